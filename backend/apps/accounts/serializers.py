@@ -1,6 +1,7 @@
 import hashlib
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from django.db import transaction
 from django.utils import timezone
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
@@ -28,7 +29,9 @@ class RegisterSerializer(serializers.ModelSerializer):
             email=validated_data.get("email", ""),
         )
         user.set_password(validated_data["password"])
-        user.save()
+        # Atomic so the analytics user counter commits together with the row.
+        with transaction.atomic():
+            user.save()
         return user
 
 
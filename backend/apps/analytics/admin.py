@@ -1,3 +1,25 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import PredictionDailyStat, TableCounter, UserPredictionStat
+
+
+@admin.register(PredictionDailyStat)
+class PredictionDailyStatAdmin(admin.ModelAdmin):
+    list_display = ("date", "role", "count", "confidence_sum", "confidence_count")
+    list_filter = ("role",)
+    date_hierarchy = "date"
+    ordering = ("-date", "role")
+
+
+@admin.register(UserPredictionStat)
+class UserPredictionStatAdmin(admin.ModelAdmin):
+    list_display = ("user", "count", "last_prediction_at")
+    search_fields = ("user__username", "user__email")
+    ordering = ("-count",)
+    list_select_related = ("user",)
+
+
+@admin.register(TableCounter)
+class TableCounterAdmin(admin.ModelAdmin):
+    list_display = ("name", "value", "reconciled_at")
+    readonly_fields = ("reconciled_at",)
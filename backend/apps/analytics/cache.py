@@ -0,0 +1,98 @@
+"""
+Response cache for the admin analytics endpoints.
+
+Every cached response is keyed on a global analytics version. The version
+is a millisecond timestamp bumped (after commit) whenever predictions or
+users are created or deleted, so it doubles as the ``Last-Modified`` time
+and stale entries are simply never read again. Keys and ETags also carry
+the local date, so day/week/month windows roll over at midnight even when
+nothing was written. The version only reaches other workers through a
+shared cache backend (``CACHE_URL``); with the per-process local-memory
+default and ``DEBUG`` off, responses are not cached at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+VERSION_KEY = "analytics:version"
+
+
+def get_analytics_version() -> int:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, int(time.time() * 1000), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_analytics_version() -> None:
+    current = cache.get(VERSION_KEY) or 0
+    # Always move to a later whole second: Last-Modified has 1s resolution.
+    cache.set(VERSION_KEY, max(int(time.time() * 1000), (current // 1000 + 1) * 1000), timeout=None)
+
+
+def invalidate_analytics() -> None:
+    """Bump the version once the current transaction commits (immediately in autocommit)."""
+    transaction.on_commit(bump_analytics_version)
+
+
+def is_shared_cache() -> bool:
+    """False for the per-process local-memory backend."""
+    return not settings.CACHES["default"]["BACKEND"].endswith(".LocMemCache")
+
+
+def cached_analytics_response(view_method):
+    """
+    Cache a GET handler's 200 responses per query string for
+    ``ANALYTICS_CACHE_TTL`` seconds and answer If-None-Match /
+    If-Modified-Since with 304 without recomputing.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        if not settings.DEBUG and not is_shared_cache():
+            # Each gunicorn worker would keep its own version and serve
+            # stale bodies/304s after writes made in another worker.
+            return view_method(self, request, *args, **kwargs)
+        version = get_analytics_version()
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        # Windows are relative to today, so a new day is a new response.
+        today = timezone.localdate()
+        digest = hashlib.sha1(f"{type(self).__name__}?{query}@{today.isoformat()}".encode("utf-8")).hexdigest()[:16]
+        etag = f'"{version}-{digest}"'
+        midnight = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        last_modified = max(version / 1000, midnight.timestamp())
+
+        not_modified = get_conditional_response(request, etag=etag, last_modified=int(last_modified))
+        if not_modified is not None:
+            return not_modified
+
+        key = f"analytics:response:{version}:{digest}"
+        data = cache.get(key)
+        if data is not None:
+            response = Response(data)
+        else:
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            cache.set(key, response.data, timeout=settings.ANALYTICS_CACHE_TTL)
+
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        # Let the browser keep the body but revalidate it on every load.
+        response["Cache-Control"] = "private, no-cache"
+        return response
+
+    return wrapper
@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+from .cache import is_shared_cache
+
+
+@register(Tags.caches, deploy=True)
+def check_analytics_cache(app_configs, **kwargs):
+    if settings.DEBUG or is_shared_cache():
+        return []
+    return [
+        Warning(
+            "The default cache is local memory, so analytics responses are not cached.",
+            hint="Set CACHE_URL to a cache shared by all workers (e.g. redis://...).",
+            id="analytics.W001",
+        )
+    ]
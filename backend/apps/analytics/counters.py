@@ -0,0 +1,93 @@
+"""
+Maintained table totals for the analytics overview.
+
+``TableCounter`` rows are adjusted with relative ``F()`` updates inside the
+transaction that inserts or deletes the counted rows, so a rollback undoes
+both. ``reconcile_counters`` recounts from the tables (run it periodically,
+e.g. from cron) and ``table_totals`` reads the numbers in the mode chosen by
+``ANALYTICS_COUNT_MODE``.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .cache import invalidate_analytics
+from .models import TableCounter
+
+COUNT_MODES = ("counter", "estimate", "exact")
+
+
+def counted_models() -> dict:
+    from apps.predictions.models import Prediction
+
+    return {"users": get_user_model(), "predictions": Prediction}
+
+
+def adjust_counter(name: str, delta: int) -> None:
+    """
+    Add ``delta`` to a counter. A missing row is left for
+    ``reconcile_counters`` (or the next read) to create from a real count.
+    """
+    if delta:
+        TableCounter.objects.filter(name=name).update(value=F("value") + delta)
+
+
+def reconcile_counters(names=None) -> dict:
+    """Recount each table and store the result. Returns ``{name: (before, after)}``."""
+    models = counted_models()
+    changes = {}
+    for name in names or models:
+        with transaction.atomic():
+            # Lock the counter before counting: a writer that has not yet
+            # adjusted it waits for us and applies its delta afterwards.
+            counter, _ = TableCounter.objects.select_for_update().get_or_create(name=name)
+            before = counter.value
+            counter.value = models[name].objects.count()
+            counter.reconciled_at = timezone.now()
+            counter.save(update_fields=["value", "reconciled_at"])
+        changes[name] = (before, counter.value)
+    if any(before != after for before, after in changes.values()):
+        invalidate_analytics()
+    return changes
+
+
+def _reltuples(tables: list[str]) -> dict:
+    """Planner row estimates from pg_class; tables never analyzed are left out."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relname, reltuples::bigint FROM pg_class WHERE relkind = 'r' AND relname = ANY(%s)",
+            [tables],
+        )
+        return {relname: estimate for relname, estimate in cursor.fetchall() if estimate >= 0}
+
+
+def table_totals() -> dict:
+    """``{name: (value, exact)}`` for every counted table."""
+    mode = settings.ANALYTICS_COUNT_MODE
+    if mode not in COUNT_MODES:
+        raise ImproperlyConfigured(f"ANALYTICS_COUNT_MODE must be one of: {', '.join(COUNT_MODES)}.")
+
+    models = counted_models()
+    if mode == "exact":
+        return {name: (model.objects.count(), True) for name, model in models.items()}
+
+    totals = {}
+    if mode == "estimate" and connection.vendor == "postgresql":
+        estimates = _reltuples([model._meta.db_table for model in models.values()])
+        for name, model in models.items():
+            if model._meta.db_table in estimates:
+                totals[name] = (estimates[model._meta.db_table], False)
+
+    missing = [name for name in models if name not in totals]
+    counters = dict(TableCounter.objects.filter(name__in=missing).values_list("name", "value"))
+    for name in missing:
+        if name not in counters:
+            counters[name] = reconcile_counters([name])[name][1]
+        totals[name] = (counters[name], True)
+    return totals
@@ -0,0 +1,29 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.analytics.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the analytics rollup tables from the Prediction table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since', help='Only rebuild daily stats from this date on (YYYY-MM-DD)')
+
+    def handle(self, *args, **options):
+        since = None
+        if options['since']:
+            try:
+                since = date.fromisoformat(options['since'])
+            except ValueError:
+                raise CommandError('--since must be a date in YYYY-MM-DD format.')
+
+        started = time.perf_counter()
+        daily, users = rebuild_rollups(since=since)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Rebuilt {daily} daily stat rows and {users} user stat rows in {time.perf_counter() - started:.2f}s.'
+            )
+        )
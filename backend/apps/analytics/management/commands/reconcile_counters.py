@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.analytics.counters import counted_models, reconcile_counters
+
+
+class Command(BaseCommand):
+    help = 'Recount the tables behind the analytics totals and correct any counter drift (run periodically)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('names', nargs='*', help='Counters to reconcile (default: all)')
+
+    def handle(self, *args, **options):
+        known = list(counted_models())
+        names = options['names'] or known
+        unknown = [name for name in names if name not in known]
+        if unknown:
+            raise CommandError(f'Unknown counters: {", ".join(unknown)}. Choose from: {", ".join(known)}.')
+
+        for name, (before, after) in reconcile_counters(names).items():
+            drift = after - before
+            note = f'corrected by {drift:+d}' if drift else 'in sync'
+            self.stdout.write(f'  {name:<12} {after:>10}  ({note})')
+        self.stdout.write(self.style.SUCCESS(f'Reconciled {len(names)} counters.'))
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-17 11:58
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PredictionDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('role', models.CharField(max_length=120)),
+                ('count', models.IntegerField(default=0)),
+                ('confidence_sum', models.FloatField(default=0.0)),
+                ('confidence_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['-date', 'role'],
+            },
+        ),
+        migrations.CreateModel(
+            name='UserPredictionStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.IntegerField(default=0)),
+                ('last_prediction_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='prediction_stat', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='predictiondailystat',
+            constraint=models.UniqueConstraint(fields=('date', 'role'), name='prediction_daily_stat_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='userpredictionstat',
+            index=models.Index(fields=['-count'], name='user_prediction_stat_count_idx'),
+        ),
+    ]
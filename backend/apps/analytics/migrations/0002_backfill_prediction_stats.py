@@ -0,0 +1,57 @@
+from django.db import migrations
+from django.db.models import Count, Max, Q, Sum
+from django.db.models.functions import Coalesce, TruncDate
+
+
+def backfill(apps, schema_editor):
+    Prediction = apps.get_model('predictions', 'Prediction')
+    PredictionDailyStat = apps.get_model('analytics', 'PredictionDailyStat')
+    UserPredictionStat = apps.get_model('analytics', 'UserPredictionStat')
+
+    predictions = Prediction.objects.order_by()
+    daily = (
+        predictions.annotate(day=TruncDate('created_at'))
+        .values('day', 'predicted_role')
+        .annotate(
+            total=Count('id'),
+            confidence_total=Coalesce(Sum('confidence'), 0.0),
+            confidence_rows=Count('id', filter=Q(confidence__isnull=False)),
+        )
+    )
+    PredictionDailyStat.objects.bulk_create(
+        (
+            PredictionDailyStat(
+                date=row['day'],
+                role=row['predicted_role'],
+                count=row['total'],
+                confidence_sum=row['confidence_total'],
+                confidence_count=row['confidence_rows'],
+            )
+            for row in daily.iterator()
+        ),
+        batch_size=1000,
+    )
+    UserPredictionStat.objects.bulk_create(
+        (
+            UserPredictionStat(user_id=row['user_id'], count=row['total'], last_prediction_at=row['last'])
+            for row in predictions.values('user_id').annotate(total=Count('id'), last=Max('created_at')).iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+def clear(apps, schema_editor):
+    apps.get_model('analytics', 'PredictionDailyStat').objects.all().delete()
+    apps.get_model('analytics', 'UserPredictionStat').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+        ('predictions', '0012_prediction_created_at_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, clear),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-17 12:02
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def seed_counters(apps, schema_editor):
+    TableCounter = apps.get_model('analytics', 'TableCounter')
+    now = timezone.now()
+    counted = {
+        'users': apps.get_model(settings.AUTH_USER_MODEL),
+        'predictions': apps.get_model('predictions', 'Prediction'),
+    }
+    TableCounter.objects.bulk_create(
+        TableCounter(name=name, value=model.objects.count(), reconciled_at=now)
+        for name, model in counted.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_backfill_prediction_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TableCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+                ('value', models.BigIntegerField(default=0)),
+                ('reconciled_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,54 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+
+class PredictionDailyStat(models.Model):
+    """
+    Per-day, per-role prediction counts, kept current as predictions are
+    created (see apps/analytics/rollups.py) so dashboards never scan the
+    Prediction table. Rebuild with `manage.py rebuild_prediction_stats`.
+    """
+    date = models.DateField()
+    role = models.CharField(max_length=120)
+    count = models.IntegerField(default=0)
+    # Sum and number of non-null confidences, for averages.
+    confidence_sum = models.FloatField(default=0.0)
+    confidence_count = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["-date", "role"]
+        constraints = [
+            models.UniqueConstraint(fields=["date", "role"], name="prediction_daily_stat_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.role}: {self.count}"
+
+
+class UserPredictionStat(models.Model):
+    """Running prediction total per user, for the top-users dashboard."""
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="prediction_stat")
+    count = models.IntegerField(default=0)
+    last_prediction_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-count"], name="user_prediction_stat_count_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}: {self.count}"
+
+
+class TableCounter(models.Model):
+    """
+    Maintained row count of a table, adjusted in the same transaction as the
+    insert or delete (see apps/analytics/counters.py) so totals never need a
+    COUNT(*). `manage.py reconcile_counters` corrects any drift.
+    """
+    name = models.CharField(max_length=64, unique=True)
+    value = models.BigIntegerField(default=0)
+    reconciled_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.name}: {self.value}"
@@ -0,0 +1,167 @@
+"""
+Incremental maintenance of the analytics rollup tables.
+
+``record_predictions`` folds a batch of new (or, with ``sign=-1``, deleted)
+predictions into ``PredictionDailyStat`` and ``UserPredictionStat`` using
+relative ``F()`` updates, so concurrent writers never overwrite each other.
+Single saves and deletes are recorded by signals; bulk paths call it
+directly because ``bulk_create`` sends no signals. Cascading and queryset
+deletes go through ``uncount_predictions`` instead, which subtracts
+grouped totals once rather than once per row. Every change also
+adjusts the predictions counter and invalidates the cached analytics
+responses.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Iterable
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Q, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from .cache import invalidate_analytics
+from .counters import adjust_counter
+from .models import PredictionDailyStat, UserPredictionStat
+
+
+def _increment(model, lookup: dict, deltas: dict, defaults: dict, create: bool = True) -> None:
+    updates = {field: F(field) + value for field, value in deltas.items()}
+    updates.update(defaults)
+    if model.objects.filter(**lookup).update(**updates) or not create:
+        return
+    try:
+        # Savepoint: a concurrent insert of the same key falls back to the update.
+        with transaction.atomic():
+            model.objects.create(**lookup, **deltas, **defaults)
+    except IntegrityError:
+        model.objects.filter(**lookup).update(**updates)
+
+
+def record_predictions(predictions: Iterable, sign: int = 1) -> None:
+    total = 0
+    daily = defaultdict(lambda: [0, 0.0, 0])
+    users = defaultdict(lambda: [0, None])
+    for prediction in predictions:
+        total += sign
+        created_at = prediction.created_at or timezone.now()
+        totals = daily[(timezone.localdate(created_at), prediction.predicted_role)]
+        totals[0] += sign
+        if prediction.confidence is not None:
+            totals[1] += sign * prediction.confidence
+            totals[2] += sign
+        user_totals = users[prediction.user_id]
+        user_totals[0] += sign
+        if sign > 0 and (user_totals[1] is None or created_at > user_totals[1]):
+            user_totals[1] = created_at
+
+    with transaction.atomic():
+        invalidate_analytics()
+        adjust_counter("predictions", total)
+        for (day, role), (count, confidence_sum, confidence_count) in daily.items():
+            _increment(
+                PredictionDailyStat,
+                {"date": day, "role": role},
+                {"count": count, "confidence_sum": confidence_sum, "confidence_count": confidence_count},
+                {},
+                create=sign > 0,
+            )
+        for user_id, (count, last_prediction_at) in users.items():
+            _increment(
+                UserPredictionStat,
+                {"user_id": user_id},
+                {"count": count},
+                {"last_prediction_at": last_prediction_at} if last_prediction_at else {},
+                # Never recreate the row of a user who is being deleted.
+                create=sign > 0,
+            )
+
+
+def uncount_predictions(queryset, users: bool = True) -> int:
+    """
+    Subtract the predictions in ``queryset`` (about to be deleted) from the
+    rollups with one grouped query per table. ``users=False`` skips the
+    per-user totals, e.g. when the users themselves are being deleted.
+    Returns the number of predictions subtracted.
+    """
+    queryset = queryset.order_by()
+    daily = (
+        queryset.annotate(day=TruncDate("created_at"))
+        .values("day", "predicted_role")
+        .annotate(
+            total=Count("id"),
+            confidence_total=Coalesce(Sum("confidence"), 0.0),
+            confidence_rows=Count("id", filter=Q(confidence__isnull=False)),
+        )
+    )
+    total = 0
+    with transaction.atomic():
+        for row in daily.iterator():
+            total += row["total"]
+            _increment(
+                PredictionDailyStat,
+                {"date": row["day"], "role": row["predicted_role"]},
+                {
+                    "count": -row["total"],
+                    "confidence_sum": -row["confidence_total"],
+                    "confidence_count": -row["confidence_rows"],
+                },
+                {},
+                create=False,
+            )
+        if users:
+            for row in queryset.values("user_id").annotate(total=Count("id")).iterator():
+                _increment(UserPredictionStat, {"user_id": row["user_id"]}, {"count": -row["total"]}, {}, create=False)
+        adjust_counter("predictions", -total)
+        invalidate_analytics()
+    return total
+
+
+def rebuild_rollups(since=None) -> tuple[int, int]:
+    """
+    Recompute the rollups from the Prediction table (from ``since`` onwards
+    for the daily table; user totals are always recomputed in full).
+    Returns the number of daily and user rows written.
+    """
+    from apps.predictions.models import Prediction
+
+    predictions = Prediction.objects.order_by()
+    daily_rows = predictions
+    if since is not None:
+        daily_rows = daily_rows.filter(created_at__date__gte=since)
+    daily_rows = (
+        daily_rows.annotate(day=TruncDate("created_at"))
+        .values("day", "predicted_role")
+        .annotate(
+            total=Count("id"),
+            confidence_total=Coalesce(Sum("confidence"), 0.0),
+            confidence_rows=Count("id", filter=Q(confidence__isnull=False)),
+        )
+    )
+    daily = [
+        PredictionDailyStat(
+            date=row["day"],
+            role=row["predicted_role"],
+            count=row["total"],
+            confidence_sum=row["confidence_total"],
+            confidence_count=row["confidence_rows"],
+        )
+        for row in daily_rows.iterator()
+    ]
+    users = [
+        UserPredictionStat(user_id=row["user_id"], count=row["total"], last_prediction_at=row["last"])
+        for row in predictions.values("user_id").annotate(total=Count("id"), last=Max("created_at")).iterator()
+    ]
+
+    with transaction.atomic():
+        stale = PredictionDailyStat.objects.all()
+        if since is not None:
+            stale = stale.filter(date__gte=since)
+        stale.delete()
+        PredictionDailyStat.objects.bulk_create(daily, batch_size=1000)
+        UserPredictionStat.objects.all().delete()
+        UserPredictionStat.objects.bulk_create(users, batch_size=1000)
+        invalidate_analytics()
+    return len(daily), len(users)
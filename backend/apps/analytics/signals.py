@@ -0,0 +1,60 @@
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.predictions.models import Prediction
+
+from .cache import invalidate_analytics
+from .counters import adjust_counter
+from .rollups import record_predictions, uncount_predictions
+
+
+@receiver(post_save, sender=Prediction)
+def count_new_prediction(sender, instance, created, raw=False, **kwargs):
+    # Edits to existing rows are not tracked; rebuild_prediction_stats repairs them.
+    if created and not raw:
+        record_predictions([instance])
+
+
+def _origin_model(origin):
+    return origin.model if isinstance(origin, QuerySet) else type(origin)
+
+
+@receiver(pre_delete, sender=Prediction)
+def uncount_deleted_predictions(sender, instance, origin=None, **kwargs):
+    # A Prediction queryset delete is subtracted once, in grouped form, on
+    # its first row; the origin is the same object for every row.
+    if isinstance(origin, QuerySet) and origin.model is Prediction and not getattr(origin, "_uncounted", False):
+        origin._uncounted = True
+        uncount_predictions(origin)
+
+
+@receiver(post_delete, sender=Prediction)
+def uncount_deleted_prediction(sender, instance, origin=None, **kwargs):
+    # Only single deletes are counted per row; queryset deletes and user
+    # cascades were already subtracted in aggregate before the delete.
+    if isinstance(origin, QuerySet) and origin.model is Prediction:
+        return
+    if _origin_model(origin) is get_user_model():
+        return
+    record_predictions([instance], sign=-1)
+
+
+@receiver(pre_delete, sender=get_user_model())
+def uncount_user_predictions(sender, instance, **kwargs):
+    # The user's UserPredictionStat row is deleted with it.
+    uncount_predictions(Prediction.objects.filter(user=instance), users=False)
+
+
+@receiver(post_save, sender=get_user_model())
+def user_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        adjust_counter("users", 1)
+        invalidate_analytics()
+
+
+@receiver(post_delete, sender=get_user_model())
+def user_deleted(sender, instance, **kwargs):
+    adjust_counter("users", -1)
+    invalidate_analytics()
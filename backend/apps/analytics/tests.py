@@ -1,3 +1,66 @@
 from django.test import TestCase
 
-# Create your tests here.
+from apps.accounts.models import User
+from apps.predictions.models import Prediction
+from apps.analytics.counters import reconcile_counters
+from apps.analytics.models import PredictionDailyStat, TableCounter, UserPredictionStat
+from apps.analytics.rollups import rebuild_rollups
+
+
+class RollupDeleteTests(TestCase):
+    """Rollups and counters must follow every kind of delete exactly."""
+
+    def setUp(self):
+        self.alice = User.objects.create_user(username="alice", email="alice@example.com", password="x")
+        self.bob = User.objects.create_user(username="bob", email="bob@example.com", password="x")
+        reconcile_counters()
+        for user in (self.alice, self.bob):
+            for index in range(6):
+                Prediction.objects.create(
+                    user=user,
+                    predicted_role="Data Scientist" if index % 2 else "DevOps Engineer",
+                    confidence=0.75,
+                )
+
+    def state(self):
+        return {
+            # Decrements leave emptied rows behind; a rebuild does not write them.
+            "daily": sorted(
+                PredictionDailyStat.objects.exclude(count=0)
+                .values_list("role", "count", "confidence_sum", "confidence_count")
+            ),
+            "users": sorted(UserPredictionStat.objects.values_list("user__username", "count")),
+            "counters": dict(TableCounter.objects.values_list("name", "value")),
+        }
+
+    def assertMatchesRebuild(self):
+        incremental = self.state()
+        rebuild_rollups()
+        reconcile_counters()
+        self.assertEqual(incremental, self.state())
+
+    def test_counts_creates(self):
+        state = self.state()
+        self.assertEqual(state["users"], [("alice", 6), ("bob", 6)])
+        self.assertEqual(state["counters"]["predictions"], 12)
+        self.assertMatchesRebuild()
+
+    def test_single_delete(self):
+        Prediction.objects.filter(user=self.alice).first().delete()
+        self.assertEqual(self.state()["counters"]["predictions"], 11)
+        self.assertMatchesRebuild()
+
+    def test_queryset_delete(self):
+        Prediction.objects.filter(predicted_role="Data Scientist").delete()
+        state = self.state()
+        self.assertEqual([row[:2] for row in state["daily"]], [("DevOps Engineer", 6)])
+        self.assertEqual(state["users"], [("alice", 3), ("bob", 3)])
+        self.assertMatchesRebuild()
+
+    def test_user_cascade_delete(self):
+        self.bob.delete()
+        state = self.state()
+        self.assertEqual(state["users"], [("alice", 6)])
+        self.assertEqual((state["counters"]["predictions"], state["counters"]["users"]), (6, 1))
+        self.assertEqual(sum(row[1] for row in state["daily"]), 6)
+        self.assertMatchesRebuild()
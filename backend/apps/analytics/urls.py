@@ -1,6 +1,7 @@
 from django.urls import path
 
 from .views import (
+    AdminAnalyticsDashboardView,
     AdminAnalyticsOverviewView,
     AdminMonthlyPredictionCountView,
     AdminRoleDistributionView,
@@ -8,6 +9,7 @@ from .views import (
 )
 
 urlpatterns = [
+    path("dashboard/", AdminAnalyticsDashboardView.as_view(), name="admin-analytics-dashboard"),
     path("overview/", AdminAnalyticsOverviewView.as_view(), name="admin-analytics-overview"),
     path("roles/", AdminRoleDistributionView.as_view(), name="admin-role-distribution"),
     path("monthly/", AdminMonthlyPredictionCountView.as_view(), name="admin-monthly-predictions"),
@@ -1,94 +1,207 @@
-from datetime import timedelta
+from datetime import date, timedelta
 
-from django.contrib.auth import get_user_model
-from django.db.models import Count
+from django.db.models import Sum
+from django.db.models.functions import Trunc
 from django.utils import timezone
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.predictions.models import Prediction
+from .cache import cached_analytics_response
+from .counters import table_totals
+from .models import PredictionDailyStat, UserPredictionStat
 
-User = get_user_model()
 
+def _role_rows():
+    """Per-role totals from the daily rollup, most predicted first."""
+    return list(
+        PredictionDailyStat.objects.values("role")
+        .annotate(
+            count=Sum("count"),
+            confidence_sum=Sum("confidence_sum"),
+            confidence_count=Sum("confidence_count"),
+        )
+        .filter(count__gt=0)
+        .order_by("-count", "role")
+    )
+
+
+def _overview(role_rows):
+    most_predicted = role_rows[0] if role_rows else {}
+    totals = table_totals()
+    return {
+        "total_users": totals["users"][0],
+        "total_predictions": totals["predictions"][0],
+        "most_predicted_role": most_predicted.get("role"),
+        "most_predicted_role_count": most_predicted.get("count", 0),
+        # False when the total is a planner estimate (ANALYTICS_COUNT_MODE=estimate).
+        "exact": {
+            "total_users": totals["users"][1],
+            "total_predictions": totals["predictions"][1],
+        },
+    }
+
+
+def _role_distribution(role_rows):
+    return {
+        "distribution": [
+            {
+                "predicted_role": row["role"],
+                "count": row["count"],
+                "avg_confidence": (
+                    round(row["confidence_sum"] / row["confidence_count"], 4) if row["confidence_count"] else None
+                ),
+            }
+            for row in role_rows
+        ]
+    }
+
+
+def _bucket_starts(kind, periods, now):
+    """The last ``periods`` bucket start dates, oldest first, ending with the current bucket."""
+    today = timezone.localtime(now).date()
+    if kind == "day":
+        return [today - timedelta(days=i) for i in range(periods - 1, -1, -1)]
+    if kind == "week":
+        monday = today - timedelta(days=today.weekday())
+        return [monday - timedelta(weeks=i) for i in range(periods - 1, -1, -1)]
+    starts = []
+    year, month = today.year, today.month
+    for _ in range(periods):
+        starts.append(date(year, month, 1))
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return starts[::-1]
+
+
+# granularity -> (label format, default periods, max periods)
+GRANULARITIES = {
+    "month": ("%Y-%m", 6, 24),
+    "week": ("%Y-%m-%d", 12, 104),
+    "day": ("%Y-%m-%d", 30, 366),
+}
+
+
+def _prediction_counts(query_params):
+    granularity = query_params.get("granularity", "month")
+    if granularity not in GRANULARITIES:
+        raise ValidationError({"granularity": f"Choose one of: {', '.join(GRANULARITIES)}."})
+    label_format, default_periods, max_periods = GRANULARITIES[granularity]
+
+    raw_periods = query_params.get("periods") or query_params.get("months") or default_periods
+    try:
+        periods = max(1, min(int(raw_periods), max_periods))
+    except (TypeError, ValueError):
+        raise ValidationError({"periods": "Must be an integer."})
+
+    starts = _bucket_starts(granularity, periods, timezone.now())
+
+    rows = (
+        PredictionDailyStat.objects.filter(date__gte=starts[0])
+        .annotate(bucket=Trunc("date", granularity))
+        .values("bucket")
+        .annotate(count=Sum("count"))
+        .order_by("bucket")
+    )
+    counts = {row["bucket"]: row["count"] for row in rows}
+
+    labels = [start.strftime(label_format) for start in starts]
+    return {
+        "granularity": granularity,
+        "labels": labels,
+        # "months" is kept for existing clients; it matches "labels".
+        "months": labels,
+        "counts": [counts.get(start, 0) for start in starts],
+    }
+
+
+def _user_stats():
+    top_users = (
+        UserPredictionStat.objects.filter(count__gt=0)
+        .select_related("user")
+        .order_by("-count")[:10]
+    )
+    return {
+        "top_users": [
+            {
+                "user_id": stat.user_id,
+                "username": stat.user.username,
+                "email": stat.user.email,
+                "prediction_count": stat.count,
+            }
+            for stat in top_users
+        ]
+    }
 
 
 class AdminAnalyticsOverviewView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @cached_analytics_response
     def get(self, request):
-        total_users = User.objects.count()
-        total_predictions = Prediction.objects.count()
-
-        most_predicted = (
-            Prediction.objects.values("predicted_role")
-            .annotate(c=Count("id"))
-            .order_by("-c")
-            .first()
-        )
-
-        return Response(
-            {
-                "total_users": total_users,
-                "total_predictions": total_predictions,
-                "most_predicted_role": (most_predicted or {}).get("predicted_role"),
-                "most_predicted_role_count": (most_predicted or {}).get("c", 0),
-            }
-        )
+        return Response(_overview(_role_rows()))
 
 
 class AdminRoleDistributionView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @cached_analytics_response
     def get(self, request):
-        rows = Prediction.objects.values("predicted_role").annotate(count=Count("id")).order_by("-count")
-        return Response({"distribution": list(rows)})
+        return Response(_role_distribution(_role_rows()))
 
 
 class AdminMonthlyPredictionCountView(APIView):
+    """
+    Prediction counts per month, week or day (``?granularity=``), summed from
+    the daily rollup and zero-filled so every bucket in the window is present.
+    """
     permission_classes = [IsAuthenticated]
 
+    @cached_analytics_response
     def get(self, request):
-        months = int(request.query_params.get("months", 6))
-        months = max(1, min(months, 24))
-
-        now = timezone.now()
-        start = now - timedelta(days=31 * months)
+        return Response(_prediction_counts(request.query_params))
 
-        qs = Prediction.objects.filter(created_at__gte=start).only("created_at")
 
-        counts = {}
-        for p in qs:
-            key = p.created_at.strftime("%Y-%m")
-            counts[key] = counts.get(key, 0) + 1
+class AdminUserStatsView(APIView):
+    permission_classes = [IsAuthenticated]
 
-        labels = sorted(counts.keys())
-        return Response({"months": labels, "counts": [counts[m] for m in labels]})
+    @cached_analytics_response
+    def get(self, request):
+        return Response(_user_stats())
 
 
-class AdminUserStatsView(APIView):
+class AdminAnalyticsDashboardView(APIView):
+    """
+    The overview, roles, monthly and users payloads in one response.
+    ``?include=overview,roles`` limits the sections; overview and roles share
+    a single grouped role query. Monthly accepts the same ``granularity`` and
+    ``periods`` parameters as its own endpoint.
+    """
     permission_classes = [IsAuthenticated]
 
-    def get(self, request):
-        top_users = (
-            Prediction.objects.values("user_id")
-            .annotate(prediction_count=Count("id"))
-            .order_by("-prediction_count")[:10]
-        )
+    SECTIONS = ("overview", "roles", "monthly", "users")
 
-        user_ids = [r["user_id"] for r in top_users]
-        user_map = {u.id: u for u in User.objects.filter(id__in=user_ids)}
-
-        enriched = []
-        for row in top_users:
-            u = user_map.get(row["user_id"])
-            enriched.append(
-                {
-                    "user_id": row["user_id"],
-                    "username": getattr(u, "username", None),
-                    "email": getattr(u, "email", None),
-                    "prediction_count": row["prediction_count"],
-                }
-            )
-
-        return Response({"top_users": enriched})
+    @cached_analytics_response
+    def get(self, request):
+        include = request.query_params.get("include")
+        if include:
+            sections = [name.strip() for name in include.split(",") if name.strip()]
+            unknown = [name for name in sections if name not in self.SECTIONS]
+            if unknown:
+                raise ValidationError(
+                    {"include": f"Unknown sections: {', '.join(unknown)}. Choose from: {', '.join(self.SECTIONS)}."}
+                )
+        else:
+            sections = self.SECTIONS
+
+        data = {}
+        role_rows = _role_rows() if {"overview", "roles"} & set(sections) else None
+        if "overview" in sections:
+            data["overview"] = _overview(role_rows)
+        if "roles" in sections:
+            data["roles"] = _role_distribution(role_rows)
+        if "monthly" in sections:
+            data["monthly"] = _prediction_counts(request.query_params)
+        if "users" in sections:
+            data["users"] = _user_stats()
+        return Response(data)
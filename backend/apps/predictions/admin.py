@@ -1,23 +1,23 @@
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import Prediction
+from .models import Prediction, ResumeBlob, ResumeJob
 from .constants import get_role_category, ROLE_CATEGORIES
 
 
 @admin.register(Prediction)
 class PredictionAdmin(admin.ModelAdmin):
     list_display = ("id", "user", "predicted_role", "role_category_badge", "confidence", "created_at")
-    list_filter = ("predicted_role", "created_at")
+    list_filter = ("predicted_role", "rule_version", "created_at")
     search_fields = ("user__username", "user__email", "predicted_role")
-    readonly_fields = ("id", "created_at", "role_category")
+    readonly_fields = ("id", "created_at", "role_category", "rule_version", "blob_text")
     ordering = ("-created_at",)
     
     fieldsets = (
         ("Basic Information", {
-            "fields": ("user", "predicted_role", "confidence")
+            "fields": ("user", "predicted_role", "confidence", "rule_version")
         }),
         ("Input Data", {
-            "fields": ("input_skills", "resume_file", "resume_text")
+            "fields": ("input_skills", "resume_file", "resume_text", "blob_text")
         }),
         ("System Information", {
             "fields": ("role_category", "created_at"),
@@ -44,6 +44,11 @@ class PredictionAdmin(admin.ModelAdmin):
         return get_role_category(obj.predicted_role)
     role_category.short_description = "Role Category"
     
+    def blob_text(self, obj):
+        """Extracted text shared through the resume blob, if any."""
+        return obj.resume_blob.text if obj.resume_blob_id else ""
+    blob_text.short_description = "Resume text (blob)"
+    
     def get_queryset(self, request):
         """Optimize queries."""
         return super().get_queryset(request).select_related('user')
@@ -53,3 +58,23 @@ class PredictionAdmin(admin.ModelAdmin):
         if db_field.name == "user":
             kwargs["queryset"] = kwargs["queryset"].select_related().order_by('username')
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
+@admin.register(ResumeJob)
+class ResumeJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "status", "attempts", "worker", "created_at", "finished_at")
+    list_filter = ("status", "created_at")
+    search_fields = ("user__username", "user__email", "worker")
+    readonly_fields = ("id", "created_at", "started_at", "finished_at", "prediction", "worker", "attempts")
+    ordering = ("-created_at",)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("user")
+
+
+@admin.register(ResumeBlob)
+class ResumeBlobAdmin(admin.ModelAdmin):
+    list_display = ("id", "sha256", "size", "pages_read", "pages_total", "extracted_at", "created_at")
+    search_fields = ("sha256",)
+    readonly_fields = ("sha256", "size", "pages_read", "pages_total", "truncated", "stopped_early", "extracted_at", "created_at")
+    ordering = ("-created_at",)
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class PredictionsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.predictions'
+
+    def ready(self):
+        from core.storage import check_download_mode
+
+        check_download_mode()
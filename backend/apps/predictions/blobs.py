@@ -0,0 +1,37 @@
+"""
+Content-addressed resume storage.
+
+Each distinct upload is stored once (named by its SHA-256, see
+``core.storage``); repeat
+uploads of the same bytes resolve to the existing ``ResumeBlob`` and its
+already-extracted text.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+from django.db import IntegrityError, transaction
+
+from core.uploads import file_sha256
+
+from .models import ResumeBlob
+
+
+def store_resume_blob(uploaded) -> Tuple[ResumeBlob, bool]:
+    """Return the blob for this upload's content, storing the file only if it is new."""
+    digest = file_sha256(uploaded)
+    blob = ResumeBlob.objects.filter(sha256=digest).first()
+    if blob is not None:
+        return blob, False
+
+    blob = ResumeBlob(sha256=digest, size=uploaded.size or 0)
+    blob.file.save(f"{digest}.pdf", uploaded, save=False)
+    try:
+        with transaction.atomic():
+            blob.save()
+    except IntegrityError:
+        # A concurrent request stored the same content first. Storage is
+        # content-addressed, so both rows point at the same file.
+        return ResumeBlob.objects.get(sha256=digest), False
+    return blob, True
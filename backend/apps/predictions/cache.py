@@ -0,0 +1,114 @@
+"""
+In-process LRU/TTL cache for skill-based predictions.
+
+Entries are keyed on a stable hash of the canonical skill IDs (see
+``SkillDictionary.canonicalize``) and tagged
+with the classifier version that produced them, so a rule reload makes every
+older entry a miss without an explicit flush.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Tuple
+
+from django.conf import settings
+
+
+def skills_cache_key(canonical_skills: Iterable[str], top_k: int) -> str:
+    digest = hashlib.sha256("\x1f".join(canonical_skills).encode("utf-8")).hexdigest()
+    return f"{top_k}:{digest}"
+
+
+class PredictionCache:
+    """Bounded, thread-safe LRU with per-entry TTL and hit/miss counters."""
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version: str | None = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: str, version: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, entry_version, value = entry
+            if entry_version != version or expires_at <= time.monotonic():
+                del self._entries[key]
+                if entry_version == version:
+                    self.expirations += 1
+                else:
+                    self.invalidations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, version: str, value) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if version != self._version:
+                # Classifier changed: nothing cached under the old version is reusable.
+                if self._entries:
+                    self.invalidations += len(self._entries)
+                    self._entries.clear()
+                self._version = version
+
+            self._entries[key] = (time.monotonic() + self.ttl, version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "version": self._version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+_cache: PredictionCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_prediction_cache() -> PredictionCache:
+    """Process-wide prediction cache configured from settings."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = PredictionCache(
+                    max_entries=settings.PREDICTION_CACHE_MAX_ENTRIES,
+                    ttl=settings.PREDICTION_CACHE_TTL,
+                )
+    return _cache
@@ -53,6 +53,13 @@ NON_TECHNICAL_ROLES = [
     "Customer Success Manager",
 ]
 
+# Constant-time lookups for the per-row helpers below
+ROLE_SET = frozenset(ALL_ROLES)
+ROLE_CATEGORY = {
+    **{role: "non_technical" for role in NON_TECHNICAL_ROLES},
+    **{role: "technical" for role in TECHNICAL_ROLES},
+}
+
 # Role descriptions for UI tooltips and professional presentation
 ROLE_DESCRIPTIONS = {
     "Data Scientist": "Analyzes complex data to help organizations make better decisions using statistical methods and machine learning.",
@@ -99,7 +106,7 @@ ROLE_CHOICES = [(role, role) for role in ALL_ROLES]
 # Helper functions
 def get_role_category(role: str) -> str:
     """Return the category of a given role."""
-    return "technical" if role in TECHNICAL_ROLES else "non_technical"
+    return ROLE_CATEGORY.get(role, "non_technical")
 
 def get_role_description(role: str) -> str:
     """Return the description of a given role."""
@@ -107,7 +114,7 @@ def get_role_description(role: str) -> str:
 
 def is_valid_role(role: str) -> bool:
     """Check if a role is valid."""
-    return role in ALL_ROLES
+    return role in ROLE_SET
 
 def get_roles_by_category(category: str) -> List[str]:
     """Get all roles in a specific category."""
@@ -0,0 +1,161 @@
+"""
+Streaming export of predictions as CSV or NDJSON.
+
+Rows are read with ``.values()`` over a server-side cursor
+(``.iterator(chunk_size=...)``) and encoded into ~64 KiB pieces, optionally
+gzip-compressed on the fly, so memory stays flat however large the table is.
+Used by ``PredictionExportView`` and ``manage.py export_predictions``.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Iterator
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from .constants import get_role_category
+from .models import Prediction
+
+EXPORT_FORMATS = {
+    # output -> (content type, file extension)
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+}
+
+EXPORT_COLUMNS = (
+    "id",
+    "user_id",
+    "username",
+    "predicted_role",
+    "role_category",
+    "confidence",
+    "rule_version",
+    "input_skills",
+    "resume_file",
+    "created_at",
+)
+
+FLUSH_BYTES = 64 * 1024
+
+
+def _day_start(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def export_queryset(
+    since: date | None = None,
+    until: date | None = None,
+    roles: Iterable[str] = (),
+    user=None,
+):
+    """
+    Predictions created between ``since`` and ``until`` (inclusive dates),
+    optionally limited to ``roles`` and one ``user`` (instance, id, username
+    or email), as dict rows in primary-key order.
+    """
+    predictions = Prediction.objects.order_by("id")
+    if since:
+        predictions = predictions.filter(created_at__gte=_day_start(since))
+    if until:
+        predictions = predictions.filter(created_at__lt=_day_start(until + timedelta(days=1)))
+    roles = list(roles)
+    if roles:
+        predictions = predictions.filter(predicted_role__in=roles)
+    if user is not None:
+        predictions = predictions.filter(user=resolve_user(user))
+    return predictions.values(
+        "id",
+        "user_id",
+        "user__username",
+        "predicted_role",
+        "confidence",
+        "rule_version",
+        "input_skills",
+        "resume_file",
+        "created_at",
+    )
+
+
+def resolve_user(identifier):
+    """A user instance from an instance, primary key, username or email; raises ``DoesNotExist``."""
+    User = get_user_model()
+    if isinstance(identifier, User):
+        return identifier
+    identifier = str(identifier)
+    if identifier.isdigit():
+        return User.objects.get(pk=int(identifier))
+    # Username first: one user's username may equal another user's email.
+    user = User.objects.filter(username=identifier).first()
+    return user or User.objects.get(email=identifier)
+
+
+def _export_rows(queryset) -> Iterator[dict]:
+    for row in queryset.iterator(chunk_size=settings.PREDICTION_EXPORT_CHUNK_SIZE):
+        yield {
+            "id": row["id"],
+            "user_id": row["user_id"],
+            "username": row["user__username"],
+            "predicted_role": row["predicted_role"],
+            "role_category": get_role_category(row["predicted_role"]),
+            "confidence": row["confidence"],
+            "rule_version": row["rule_version"],
+            "input_skills": row["input_skills"],
+            "resume_file": row["resume_file"] or "",
+            "created_at": row["created_at"].isoformat(),
+        }
+
+
+def _iter_csv(rows: Iterator[dict]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        row["input_skills"] = json.dumps(row["input_skills"], separators=(",", ":"))
+        writer.writerow([row[column] for column in EXPORT_COLUMNS])
+        if buffer.tell() >= FLUSH_BYTES:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _iter_ndjson(rows: Iterator[dict]) -> Iterator[str]:
+    encoder = json.JSONEncoder(separators=(",", ":"))
+    pieces, size = [], 0
+    for row in rows:
+        line = encoder.encode(row) + "\n"
+        pieces.append(line)
+        size += len(line)
+        if size >= FLUSH_BYTES:
+            yield "".join(pieces)
+            pieces, size = [], 0
+    yield "".join(pieces)
+
+
+def _gzip(chunks: Iterator[bytes], level: int = 6) -> Iterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_export(queryset, output: str = "csv", compress: bool = False) -> Iterator[bytes]:
+    """Encoded export of ``queryset`` (from ``export_queryset``) as a byte stream."""
+    encode = _iter_csv if output == "csv" else _iter_ndjson
+    chunks = (text.encode("utf-8") for text in encode(_export_rows(queryset)) if text)
+    return _gzip(chunks) if compress else chunks
+
+
+def export_filename(output: str, compress: bool = False) -> str:
+    extension = EXPORT_FORMATS[output][1]
+    name = f"predictions-{timezone.localdate():%Y%m%d}.{extension}"
+    return f"{name}.gz" if compress else name
@@ -0,0 +1,122 @@
+"""
+Database-backed queue for asynchronous resume predictions.
+
+Jobs are claimed with a conditional UPDATE (status queued -> running), so any
+number of worker processes can poll the same table safely without an
+external broker.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.pdf_sandbox import PdfExtractionError
+
+from .blobs import store_resume_blob
+from .models import Prediction, ResumeJob
+from .services import predict_role_from_resume, predict_role_from_resume_blob
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_resume_job(user, resume) -> ResumeJob:
+    """Store the upload (once per distinct content) and queue it for a worker."""
+    blob, _ = store_resume_blob(resume)
+    return ResumeJob.objects.create(user=user, resume_file=blob.file.name, resume_blob=blob)
+
+
+def claim_next_job(worker_id: str) -> ResumeJob | None:
+    """Atomically take the oldest queued job, or return None if the queue is empty."""
+    candidates = (
+        ResumeJob.objects.filter(status=ResumeJob.STATUS_QUEUED)
+        .order_by("created_at")
+        .values_list("id", flat=True)[:10]
+    )
+    for job_id in candidates:
+        claimed = ResumeJob.objects.filter(id=job_id, status=ResumeJob.STATUS_QUEUED).update(
+            status=ResumeJob.STATUS_RUNNING,
+            worker=worker_id,
+            started_at=timezone.now(),
+            attempts=F("attempts") + 1,
+        )
+        if claimed:
+            return ResumeJob.objects.select_related("user", "resume_blob").get(id=job_id)
+    return None
+
+
+def _fail_or_requeue(job: ResumeJob, exc: Exception) -> ResumeJob:
+    # Unreadable PDFs fail the same way every time; only a busy sandbox is worth retrying.
+    retryable = not isinstance(exc, PdfExtractionError) or exc.reason == "busy"
+    retry = retryable and job.attempts < settings.RESUME_JOB_MAX_ATTEMPTS
+    job.prediction = None
+    job.status = ResumeJob.STATUS_QUEUED if retry else ResumeJob.STATUS_FAILED
+    job.error = str(exc)[:2000]
+    job.finished_at = None if retry else timezone.now()
+    try:
+        job.save(update_fields=["prediction", "status", "error", "finished_at"])
+    except Exception:
+        # The database itself is failing; requeue_stale_jobs picks the job up later.
+        logger.exception("Could not record the failure of resume job %s", job.pk)
+    return job
+
+
+def process_job(job: ResumeJob) -> ResumeJob:
+    """
+    Classify a claimed job and attach the resulting Prediction. Failures in
+    either step requeue or fail the job instead of escaping to the worker loop.
+    """
+    try:
+        if job.resume_blob is not None:
+            analysis = predict_role_from_resume_blob(job.resume_blob)
+        else:
+            with job.resume_file.open("rb") as fh:
+                analysis = predict_role_from_resume(fh)
+    except Exception as exc:
+        logger.exception("Resume job %s failed", job.pk)
+        return _fail_or_requeue(job, exc)
+
+    result = analysis.result
+    try:
+        with transaction.atomic():
+            prediction = Prediction.objects.create(
+                user=job.user,
+                # Point at the file the job already stored instead of copying it.
+                resume_file=job.resume_file.name,
+                # The blob holds the text; only legacy jobs without one keep a copy.
+                resume_text="" if job.resume_blob is not None else analysis.text,
+                resume_blob=job.resume_blob,
+                predicted_role=result.role,
+                confidence=result.confidence,
+                rule_version=result.rule_version,
+                explanation=result.explanation,
+            )
+            job.prediction = prediction
+            job.status = ResumeJob.STATUS_DONE
+            job.error = ""
+            job.pages_read = analysis.pages_read
+            job.pages_total = analysis.pages_total
+            job.finished_at = timezone.now()
+            job.save(update_fields=["prediction", "status", "error", "pages_read", "pages_total", "finished_at"])
+    except Exception as exc:
+        logger.exception("Saving the result of resume job %s failed", job.pk)
+        return _fail_or_requeue(job, exc)
+    return job
+
+
+def requeue_stale_jobs(stale_after: timedelta) -> int:
+    """Return jobs whose worker died mid-run to the queue (or fail them if out of attempts)."""
+    cutoff = timezone.now() - stale_after
+    stale = ResumeJob.objects.filter(status=ResumeJob.STATUS_RUNNING, started_at__lt=cutoff)
+    failed = stale.filter(attempts__gte=settings.RESUME_JOB_MAX_ATTEMPTS).update(
+        status=ResumeJob.STATUS_FAILED,
+        error="Worker stopped before finishing the job.",
+        finished_at=timezone.now(),
+    )
+    requeued = stale.update(status=ResumeJob.STATUS_QUEUED, worker="")
+    return failed + requeued
@@ -0,0 +1,54 @@
+import sys
+from datetime import date
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.predictions.exports import EXPORT_FORMATS, export_queryset, stream_export
+
+
+def parse_date(value, option):
+    try:
+        return date.fromisoformat(value) if value else None
+    except ValueError:
+        raise CommandError(f'{option} must be a date in YYYY-MM-DD format.')
+
+
+class Command(BaseCommand):
+    help = 'Stream predictions to a CSV or NDJSON file (optionally gzipped) with flat memory use'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', choices=sorted(EXPORT_FORMATS), default='csv', help='Export format')
+        parser.add_argument('--gzip', action='store_true', help='Gzip the export')
+        parser.add_argument('--file', default='-', help='Destination path (default: stdout)')
+        parser.add_argument('--since', help='First creation date to include (YYYY-MM-DD)')
+        parser.add_argument('--until', help='Last creation date to include (YYYY-MM-DD)')
+        parser.add_argument('--role', action='append', default=[], help='Only this predicted role (repeatable)')
+        parser.add_argument('--user', help='Only predictions of this user (id, username or email)')
+
+    def handle(self, *args, **options):
+        since = parse_date(options['since'], '--since')
+        until = parse_date(options['until'], '--until')
+        if since and until and since > until:
+            raise CommandError('--since must not be after --until.')
+        try:
+            queryset = export_queryset(since=since, until=until, roles=options['role'], user=options['user'])
+        except ObjectDoesNotExist:
+            raise CommandError(f'No user matches "{options["user"]}".')
+
+        chunks = stream_export(queryset, output=options['output'], compress=options['gzip'])
+        to_stdout = options['file'] == '-'
+        written = 0
+        fh = sys.stdout.buffer if to_stdout else open(options['file'], 'wb')
+        try:
+            for chunk in chunks:
+                fh.write(chunk)
+                written += len(chunk)
+        finally:
+            if to_stdout:
+                fh.flush()
+            else:
+                fh.close()
+
+        if not to_stdout:
+            self.stdout.write(self.style.SUCCESS(f'Wrote {written} bytes to {options["file"]}.'))
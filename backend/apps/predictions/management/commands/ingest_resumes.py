@@ -0,0 +1,264 @@
+import hashlib
+import io
+import json
+import os
+import tarfile
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.analytics.rollups import record_predictions
+from apps.predictions.models import Prediction, ResumeBlob
+from apps.predictions.services import (
+    predict_role_from_resume,
+    predict_roles_from_texts,
+    resume_prediction_from_blob,
+)
+from core.pdf_sandbox import PdfExtractionError, PdfSandboxPool
+
+
+def iter_source(source):
+    """Yield (key, read) pairs for every PDF in a directory tree or tarball, in a stable order."""
+    if os.path.isdir(source):
+        root = Path(source)
+        for path in sorted(root.rglob('*')):
+            if path.is_file() and path.suffix.lower() == '.pdf':
+                yield str(path.relative_to(root)), path.read_bytes
+    elif os.path.isfile(source) and tarfile.is_tarfile(source):
+        with tarfile.open(source, 'r:*') as archive:
+            for member in archive:
+                if member.isfile() and member.name.lower().endswith('.pdf'):
+                    yield member.name, lambda member=member: archive.extractfile(member).read()
+    else:
+        raise CommandError(f'{source} is neither a directory nor a tar archive.')
+
+
+def load_checkpoint(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(path, state):
+    """Write the checkpoint atomically so an interruption never leaves it half-written."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+            json.dump(state, fh, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class Command(BaseCommand):
+    help = 'Classify a directory or tarball of resume PDFs and store the predictions in bulk'
+
+    def add_arguments(self, parser):
+        parser.add_argument('source', help='Directory (searched recursively) or .tar/.tar.gz of PDFs')
+        parser.add_argument('--user', required=True, help='Username or email that will own the predictions')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='PDF extraction processes')
+        parser.add_argument('--chunk-size', type=int, default=100, help='Documents per bulk insert and checkpoint')
+        parser.add_argument('--checkpoint', help='Checkpoint file (default: <source>.ingest.json)')
+        parser.add_argument('--restart', action='store_true', help='Ignore an existing checkpoint')
+        parser.add_argument('--limit', type=int, help='Stop after this many documents')
+
+    def handle(self, *args, **options):
+        source = os.path.abspath(options['source'])
+        user = self._get_user(options['user'])
+        checkpoint_path = options['checkpoint'] or f'{source.rstrip(os.sep)}.ingest.json'
+
+        state = None if options['restart'] else load_checkpoint(checkpoint_path)
+        if state and state.get('source') != source:
+            raise CommandError(f'{checkpoint_path} belongs to {state.get("source")}; use --restart or --checkpoint.')
+        state = state or {'source': source, 'done': 0, 'last_key': None, 'created': 0, 'failed': 0}
+
+        items = iter_source(source)
+        if state['done']:
+            skipped = list(islice(items, state['done']))
+            if len(skipped) < state['done'] or skipped[-1][0] != state['last_key']:
+                raise CommandError('The source changed since the checkpoint was written; use --restart.')
+            self.stdout.write(f'Resuming after {state["done"]} documents ({state["last_key"]}).')
+        if options['limit']:
+            items = islice(items, options['limit'])
+
+        pool = PdfSandboxPool(
+            workers=options['workers'],
+            timeout=settings.PDF_SANDBOX_TIMEOUT,
+            memory_limit_mb=settings.PDF_SANDBOX_MEMORY_MB,
+            max_jobs_per_worker=settings.PDF_SANDBOX_MAX_JOBS_PER_WORKER,
+            queue_timeout=settings.PDF_SANDBOX_QUEUE_TIMEOUT,
+        )
+        timings = {'read': 0.0, 'extract': 0.0, 'classify': 0.0, 'write': 0.0}
+        processed = created = failed = 0
+        started = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=pool.workers) as executor:
+                while True:
+                    # Read while the source is still being iterated (a tarball closes once exhausted).
+                    mark = time.perf_counter()
+                    chunk = [(key, read()) for key, read in islice(items, options['chunk_size'])]
+                    timings['read'] += time.perf_counter() - mark
+                    if not chunk:
+                        break
+                    chunk_created, chunk_failed = self._ingest_chunk(chunk, user, pool, executor, timings)
+                    processed += len(chunk)
+                    created += chunk_created
+                    failed += chunk_failed
+
+                    # Rows are committed before the checkpoint moves, so an interruption
+                    # in between re-ingests at most one chunk.
+                    state.update(
+                        done=state['done'] + len(chunk),
+                        last_key=chunk[-1][0],
+                        created=state['created'] + chunk_created,
+                        failed=state['failed'] + chunk_failed,
+                        updated_at=timezone.now().isoformat(),
+                    )
+                    save_checkpoint(checkpoint_path, state)
+
+                    elapsed = time.perf_counter() - started
+                    self.stdout.write(
+                        f'  {state["done"]} documents ({created} created, {failed} failed), '
+                        f'{processed / elapsed:.1f} docs/sec'
+                    )
+        finally:
+            pool.shutdown()
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write('Stage timings (extract/classify are summed across workers):')
+        for stage, seconds in timings.items():
+            per_doc = seconds / processed * 1000 if processed else 0.0
+            self.stdout.write(f'  {stage:<9} {seconds:8.2f}s  {per_doc:7.1f} ms/doc')
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Ingested {processed} documents in {elapsed:.1f}s '
+                f'({processed / elapsed if elapsed else 0:.1f} docs/sec): {created} predictions created, {failed} failed. '
+                f'Checkpoint: {checkpoint_path}'
+            )
+        )
+
+    def _get_user(self, identifier):
+        User = get_user_model()
+        try:
+            return User.objects.get(Q(username=identifier) | Q(email=identifier))
+        except (User.DoesNotExist, User.MultipleObjectsReturned):
+            raise CommandError(f'No unique user matches "{identifier}".')
+
+    def _ingest_chunk(self, chunk, user, pool, executor, timings):
+        mark = time.perf_counter()
+        documents = [(key, data, hashlib.sha256(data).hexdigest()) for key, data in chunk]
+        timings['read'] += time.perf_counter() - mark
+
+        # Content seen before (in earlier chunks, runs or uploads) is classified from its stored text.
+        digests = {digest for _, _, digest in documents}
+        blobs = {
+            blob.sha256: blob
+            for blob in ResumeBlob.objects.filter(sha256__in=digests, extracted_at__isnull=False)
+        }
+        analyses = {}
+        known = list(blobs.values())
+        if known:
+            mark = time.perf_counter()
+            results = predict_roles_from_texts([blob.text for blob in known])
+            timings['classify'] += time.perf_counter() - mark
+            for blob, result in zip(known, results):
+                analyses[blob.sha256] = resume_prediction_from_blob(blob, result)
+
+        pending = {digest: data for _, data, digest in documents if digest not in analyses}
+        errors = {}
+
+        def analyze(item):
+            digest, data = item
+            try:
+                return digest, predict_role_from_resume(io.BytesIO(data), pool=pool)
+            except PdfExtractionError as exc:
+                return digest, exc
+
+        for digest, analysis in executor.map(analyze, pending.items()):
+            if isinstance(analysis, PdfExtractionError):
+                errors[digest] = analysis
+                continue
+            analyses[digest] = analysis
+            timings['extract'] += analysis.extract_seconds
+            timings['classify'] += analysis.classify_seconds
+
+        mark = time.perf_counter()
+        new_blobs = []
+        for digest, data in pending.items():
+            if digest not in analyses:
+                continue
+            analysis = analyses[digest]
+            blob = ResumeBlob(
+                sha256=digest,
+                size=len(data),
+                text=analysis.text,
+                pages_read=analysis.pages_read,
+                pages_total=analysis.pages_total,
+                truncated=analysis.truncated,
+                stopped_early=analysis.stopped_early,
+                extracted_at=timezone.now(),
+            )
+            blob.file.save(f'{digest}.pdf', ContentFile(data), save=False)
+            new_blobs.append(blob)
+
+        with transaction.atomic():
+            if new_blobs:
+                ResumeBlob.objects.bulk_create(new_blobs, ignore_conflicts=True)
+                # A conflicting row stored by an upload but never extracted keeps
+                # its NULL extracted_at; fill it in from this run's extraction.
+                unextracted = ResumeBlob.objects.filter(
+                    sha256__in=[b.sha256 for b in new_blobs], extracted_at__isnull=True
+                )
+                stale = set(unextracted.values_list('sha256', flat=True))
+                for blob in new_blobs:
+                    if blob.sha256 in stale:
+                        unextracted.filter(sha256=blob.sha256).update(
+                            text=blob.text,
+                            pages_read=blob.pages_read,
+                            pages_total=blob.pages_total,
+                            truncated=blob.truncated,
+                            stopped_early=blob.stopped_early,
+                            extracted_at=blob.extracted_at,
+                        )
+                blobs.update(
+                    (blob.sha256, blob)
+                    for blob in ResumeBlob.objects.filter(sha256__in=[b.sha256 for b in new_blobs])
+                )
+
+            predictions = []
+            for key, _, digest in documents:
+                if digest in errors:
+                    self.stderr.write(f'  {key}: {errors[digest]} ({errors[digest].reason})')
+                    continue
+                analysis, blob = analyses[digest], blobs[digest]
+                result = analysis.result
+                predictions.append(
+                    Prediction(
+                        user=user,
+                        resume_file=blob.file.name,
+                        resume_blob=blob,
+                        predicted_role=result.role,
+                        confidence=result.confidence,
+                        rule_version=result.rule_version,
+                        explanation=result.explanation,
+                    )
+                )
+            Prediction.objects.bulk_create(predictions)
+            record_predictions(predictions)
+        timings['write'] += time.perf_counter() - mark
+        return len(predictions), len(documents) - len(predictions)
@@ -0,0 +1,109 @@
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from datetime import timedelta
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+
+def run_worker(poll_interval, stale_after, once=False, max_jobs=0):
+    """Claim and process jobs until stopped; runs in-process or in a child process."""
+    if not apps.ready:
+        # Spawned (not forked) children start with a fresh interpreter.
+        django.setup()
+    from apps.predictions.jobs import claim_next_job, process_job, requeue_stale_jobs
+
+    worker_id = f'{socket.gethostname()}:{os.getpid()}'[:64]
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    processed = 0
+    next_sweep = 0.0
+    try:
+        while not stopping:
+            if time.monotonic() >= next_sweep:
+                requeue_stale_jobs(timedelta(seconds=stale_after))
+                next_sweep = time.monotonic() + max(stale_after / 2, poll_interval)
+
+            job = claim_next_job(worker_id)
+            if job is None:
+                if once:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            process_job(job)
+            processed += 1
+            if max_jobs and processed >= max_jobs:
+                break
+    finally:
+        connections.close_all()
+    return processed
+
+
+class Command(BaseCommand):
+    help = 'Process queued resume prediction jobs from the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=1, help='Number of worker processes')
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=settings.RESUME_JOB_POLL_INTERVAL,
+            help='Seconds to wait when the queue is empty',
+        )
+        parser.add_argument(
+            '--stale-after',
+            type=int,
+            default=settings.RESUME_JOB_STALE_AFTER,
+            help='Requeue running jobs whose worker has been silent this many seconds',
+        )
+        parser.add_argument('--once', action='store_true', help='Exit once the queue is empty')
+        parser.add_argument('--max-jobs', type=int, default=0, help='Exit after this many jobs per worker')
+
+    def handle(self, *args, **options):
+        worker_args = (options['poll_interval'], options['stale_after'], options['once'], options['max_jobs'])
+        workers = max(options['workers'], 1)
+
+        if workers == 1:
+            processed = run_worker(*worker_args)
+            self.stdout.write(self.style.SUCCESS(f'Processed {processed} resume job(s).'))
+            return
+
+        # Children must not share the parent's database connection.
+        connections.close_all()
+        processes = [
+            multiprocessing.Process(target=run_worker, args=worker_args, name=f'resume-worker-{i}')
+            for i in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        self.stdout.write(f'Started {workers} resume workers: {", ".join(str(p.pid) for p in processes)}')
+
+        def forward(signum, frame):
+            for process in processes:
+                if process.is_alive():
+                    os.kill(process.pid, signal.SIGTERM)
+
+        signal.signal(signal.SIGTERM, forward)
+        signal.signal(signal.SIGINT, forward)
+        for process in processes:
+            process.join()
+
+        failed = [p for p in processes if p.exitcode]
+        if failed:
+            self.stderr.write(f'{len(failed)} worker(s) exited with an error.')
+        else:
+            self.stdout.write(self.style.SUCCESS('All resume workers stopped.'))
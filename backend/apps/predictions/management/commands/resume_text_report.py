@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+from django.db.models.functions import Length
+
+from apps.predictions.models import Prediction, ResumeBlob
+
+
+class Command(BaseCommand):
+    help = 'Report how much space compressed resume text saves'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows decompressed per fetch')
+
+    def handle(self, *args, **options):
+        totals = [0, 0]
+        for label, model, field in (
+            ('Prediction.resume_text', Prediction, 'resume_text'),
+            ('ResumeBlob.text', ResumeBlob, 'text'),
+        ):
+            queryset = model.objects.order_by()
+            summary = queryset.aggregate(rows=Count('pk'), stored=Sum(Length(field)))
+            stored = summary['stored'] or 0
+            raw = sum(
+                len(text.encode('utf-8'))
+                for text in queryset.values_list(field, flat=True).iterator(chunk_size=options['chunk_size'])
+            )
+            totals[0] += raw
+            totals[1] += stored
+            self.stdout.write(f'{label}: {summary["rows"]} rows, {self._describe(raw, stored)}')
+
+        self.stdout.write(self.style.SUCCESS(f'Total: {self._describe(*totals)}'))
+
+    @staticmethod
+    def _describe(raw, stored):
+        saved = raw - stored
+        ratio = f'{raw / stored:.1f}x' if stored else 'n/a'
+        return (
+            f'{raw / 1024:.1f} KB uncompressed, {stored / 1024:.1f} KB stored, '
+            f'{saved / 1024:.1f} KB saved ({ratio})'
+        )
@@ -0,0 +1,69 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.predictions.model import MODEL_VERSION_PREFIX, RoleModelTrainer, iter_training_rows
+from apps.predictions.models import Prediction
+
+
+class Command(BaseCommand):
+    help = 'Train the statistical role model from historical Prediction rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default=settings.PREDICTION_MODEL_PATH, help='Where to write the model file')
+        parser.add_argument('--features', type=int, default=2 ** 16, help='Number of hashed features')
+        parser.add_argument('--alpha', type=float, default=0.1, help='Additive smoothing')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows fetched and vectorized per step')
+        parser.add_argument('--since', help='Only train on rows created on or after this date (YYYY-MM-DD)')
+        parser.add_argument('--limit', type=int, help='Train on at most this many rows')
+        parser.add_argument('--min-rows', type=int, default=100, help='Refuse to write a model trained on fewer rows')
+        parser.add_argument(
+            '--include-model-predictions',
+            action='store_true',
+            help='Also learn from rows the model itself labelled',
+        )
+
+    def handle(self, *args, **options):
+        queryset = Prediction.objects.order_by()
+        if options['since']:
+            queryset = queryset.filter(created_at__date__gte=options['since'])
+        if not options['include_model_predictions']:
+            queryset = queryset.exclude(rule_version__startswith=MODEL_VERSION_PREFIX)
+        if options['limit']:
+            queryset = queryset.order_by('-id')[:options['limit']]
+
+        chunk_size = options['chunk_size']
+        trainer = RoleModelTrainer(n_features=options['features'])
+        started = time.perf_counter()
+
+        texts, roles = [], []
+        for text, role in iter_training_rows(queryset, chunk_size):
+            texts.append(text)
+            roles.append(role)
+            if len(texts) >= chunk_size:
+                trainer.partial_fit(texts, roles)
+                texts, roles = [], []
+                if options['verbosity'] >= 2:
+                    self.stdout.write(f'  {trainer.rows} rows...')
+        trainer.partial_fit(texts, roles)
+
+        if trainer.rows < options['min_rows']:
+            raise CommandError(
+                f'Only {trainer.rows} usable rows found; need at least {options["min_rows"]} (see --min-rows).'
+            )
+
+        model = trainer.build(alpha=options['alpha'])
+        model.save(options['output'])
+        elapsed = time.perf_counter() - started
+
+        for role, count in zip(trainer.roles, trainer.class_counts):
+            if count:
+                self.stdout.write(f'  {role}: {int(count)}')
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Trained model {model.version} on {trainer.rows} rows in {elapsed:.1f}s '
+                f'({os.path.getsize(options["output"]) / 1024:.0f} KB written to {options["output"]}).'
+            )
+        )
@@ -0,0 +1,108 @@
+"""
+Compiled multi-pattern keyword matcher used by the role classifier.
+
+Builds an Aho-Corasick automaton once from the keyword tables so a text can be
+scanned in a single left-to-right pass, independent of how many keywords or
+roles are configured.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    keyword: str
+    start: int
+    end: int
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over lowercase keywords and phrases.
+
+    Matches are only reported on word boundaries, so "ml" does not hit
+    "html" and "hr" does not hit "three".
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(k.lower() for k in keywords if k))
+
+        for keyword in self.keywords:
+            self._add(keyword)
+        self._build_failure_links()
+
+    def _add(self, keyword: str) -> None:
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state] = self._output[state] + (keyword,)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[KeywordMatch]:
+        """
+        Scan already-lowercased text once and yield every keyword occurrence
+        that starts and ends on a word boundary.
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        length = len(text)
+        state = 0
+
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not output[state]:
+                continue
+
+            end = index + 1
+            if end < length and _is_word_char(char) and _is_word_char(text[end]):
+                continue
+            for keyword in output[state]:
+                start = end - len(keyword)
+                if start > 0 and _is_word_char(keyword[0]) and _is_word_char(text[start - 1]):
+                    continue
+                yield KeywordMatch(keyword=keyword, start=start, end=end)
+
+    def find_longest(self, text: str) -> List[KeywordMatch]:
+        """
+        Leftmost-longest, non-overlapping matches, so "react.js" counts once
+        instead of as "react", "react.js" and "js".
+        """
+        selected: List[KeywordMatch] = []
+        covered_until = 0
+        for match in sorted(self.iter_matches(text), key=lambda m: (m.start, m.start - m.end)):
+            if match.start >= covered_until:
+                selected.append(match)
+                covered_until = match.end
+        return selected
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 11:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0003_alter_prediction_predicted_role'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='prediction',
+            name='rule_version',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
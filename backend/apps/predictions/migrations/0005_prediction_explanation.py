@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 11:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0004_prediction_rule_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='prediction',
+            name='explanation',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
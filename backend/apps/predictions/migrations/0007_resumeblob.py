@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-17 11:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0006_resumejob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('file', models.FileField(upload_to='resumes/')),
+                ('size', models.PositiveBigIntegerField(default=0)),
+                ('text', models.TextField(blank=True)),
+                ('pages_read', models.PositiveIntegerField(blank=True, null=True)),
+                ('pages_total', models.PositiveIntegerField(blank=True, null=True)),
+                ('truncated', models.BooleanField(default=False)),
+                ('stopped_early', models.BooleanField(default=False)),
+                ('extracted_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='prediction',
+            name='resume_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='predictions', to='predictions.resumeblob'),
+        ),
+        migrations.AddField(
+            model_name='resumejob',
+            name='resume_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='jobs', to='predictions.resumeblob'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations
+
+import core.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0007_resumeblob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='prediction',
+            name='resume_text_compressed',
+            field=core.fields.CompressedTextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name='resumeblob',
+            name='text_compressed',
+            field=core.fields.CompressedTextField(blank=True),
+        ),
+    ]
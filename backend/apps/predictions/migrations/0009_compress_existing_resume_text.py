@@ -0,0 +1,45 @@
+from django.db import migrations, transaction
+
+BATCH_SIZE = 500
+
+FIELDS = (
+    ('Prediction', 'resume_text', 'resume_text_compressed'),
+    ('ResumeBlob', 'text', 'text_compressed'),
+)
+
+
+def _copy(apps, source_index, target_index):
+    for model_name, *fields in FIELDS:
+        model = apps.get_model('predictions', model_name)
+        source, target = fields[source_index], fields[target_index]
+        last_pk = 0
+        while True:
+            # One short transaction per batch so large tables never hold long locks.
+            with transaction.atomic():
+                rows = list(model.objects.filter(pk__gt=last_pk).order_by('pk').only('pk', source)[:BATCH_SIZE])
+                if not rows:
+                    break
+                for row in rows:
+                    setattr(row, target, getattr(row, source))
+                model.objects.bulk_update(rows, [target])
+            last_pk = rows[-1].pk
+
+
+def compress_text(apps, schema_editor):
+    _copy(apps, 0, 1)
+
+
+def decompress_text(apps, schema_editor):
+    _copy(apps, 1, 0)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('predictions', '0008_compressed_resume_text'),
+    ]
+
+    operations = [
+        migrations.RunPython(compress_text, decompress_text),
+    ]
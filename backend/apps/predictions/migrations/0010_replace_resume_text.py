@@ -0,0 +1,29 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0009_compress_existing_resume_text'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='prediction',
+            name='resume_text',
+        ),
+        migrations.RenameField(
+            model_name='prediction',
+            old_name='resume_text_compressed',
+            new_name='resume_text',
+        ),
+        migrations.RemoveField(
+            model_name='resumeblob',
+            name='text',
+        ),
+        migrations.RenameField(
+            model_name='resumeblob',
+            old_name='text_compressed',
+            new_name='text',
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-17 11:56
+
+import core.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0010_replace_resume_text'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='prediction',
+            name='resume_file',
+            field=models.FileField(blank=True, null=True, storage=core.storage.get_resume_storage, upload_to='resumes/'),
+        ),
+        migrations.AlterField(
+            model_name='resumeblob',
+            name='file',
+            field=models.FileField(storage=core.storage.get_resume_storage, upload_to='resumes/'),
+        ),
+        migrations.AlterField(
+            model_name='resumejob',
+            name='resume_file',
+            field=models.FileField(storage=core.storage.get_resume_storage, upload_to='resumes/'),
+        ),
+    ]
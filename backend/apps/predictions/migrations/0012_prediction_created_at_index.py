@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 11:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0011_resume_storage'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='prediction',
+            index=models.Index(fields=['created_at'], name='prediction_created_at_idx'),
+        ),
+    ]
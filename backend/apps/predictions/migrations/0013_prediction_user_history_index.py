@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0012_prediction_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='prediction',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='prediction_user_history_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+from django.db import migrations, transaction
+
+BATCH_SIZE = 500
+
+
+def _rows(model):
+    # Only rows whose blob carries extracted text; the rest keep their copy.
+    return model.objects.filter(resume_blob__isnull=False, resume_blob__extracted_at__isnull=False)
+
+
+def clear_duplicate_text(apps, schema_editor):
+    Prediction = apps.get_model('predictions', 'Prediction')
+    last_pk = 0
+    while True:
+        # One short transaction per batch so large tables never hold long locks.
+        with transaction.atomic():
+            pks = list(_rows(Prediction).filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:BATCH_SIZE])
+            if not pks:
+                break
+            Prediction.objects.filter(pk__in=pks).update(resume_text='')
+        last_pk = pks[-1]
+
+
+def restore_text(apps, schema_editor):
+    Prediction = apps.get_model('predictions', 'Prediction')
+    last_pk = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                _rows(Prediction).filter(pk__gt=last_pk).order_by('pk')
+                .select_related('resume_blob').only('pk', 'resume_blob__text')[:BATCH_SIZE]
+            )
+            if not rows:
+                break
+            for row in rows:
+                row.resume_text = row.resume_blob.text
+            Prediction.objects.bulk_update(rows, ['resume_text'])
+        last_pk = rows[-1].pk
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('predictions', '0013_prediction_user_history_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_duplicate_text, restore_text),
+    ]
@@ -0,0 +1,226 @@
+"""
+CPU-only statistical role model.
+
+A multinomial Naive Bayes over hashed, TF-IDF weighted unigrams and bigrams.
+Training streams rows and only keeps per-role feature sums, so memory is
+bounded by ``roles x n_features`` regardless of how many rows are seen.
+Inference is a single sparse x dense matrix product.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import zlib
+from typing import Iterable, List, Sequence
+
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+from scipy import sparse
+
+from .constants import ALL_ROLES
+from .scoring import RoleScore
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+MODEL_VERSION_PREFIX = "model:"
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens plus adjacent-word bigrams."""
+    words = _TOKEN_RE.findall((text or "").lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def _feature_index(token: str, n_features: int) -> int:
+    # crc32 is stable across processes, unlike the salted built-in hash().
+    return zlib.crc32(token.encode("utf-8")) % n_features
+
+
+def term_frequencies(texts: Sequence[str], n_features: int) -> sparse.csr_matrix:
+    """Hashed, sublinear (1 + log tf) term-frequency matrix, one row per text."""
+    rows: List[int] = []
+    columns: List[int] = []
+    for row, text in enumerate(texts):
+        for token in tokenize(text):
+            rows.append(row)
+            columns.append(_feature_index(token, n_features))
+    counts = sparse.csr_matrix(
+        (np.ones(len(columns), dtype=np.float32), (rows, columns)),
+        shape=(len(texts), n_features),
+    )
+    counts.sum_duplicates()
+    counts.data = 1.0 + np.log(counts.data)
+    return counts
+
+
+class RoleModelTrainer:
+    """
+    Streaming trainer. IDF weights factor out of the per-role sums, so a
+    single pass collecting term frequencies and document frequencies is
+    enough to fit TF-IDF Naive Bayes exactly.
+    """
+
+    def __init__(self, n_features: int = 2 ** 16, roles: Sequence[str] = ALL_ROLES):
+        self.n_features = n_features
+        self.roles = tuple(roles)
+        self._role_index = {role: i for i, role in enumerate(self.roles)}
+        self.feature_sums = np.zeros((len(self.roles), n_features))
+        self.document_frequency = np.zeros(n_features)
+        self.class_counts = np.zeros(len(self.roles))
+        self.rows = 0
+
+    def partial_fit(self, texts: Sequence[str], roles: Sequence[str]) -> None:
+        if not texts:
+            return
+        tf = term_frequencies(texts, self.n_features)
+        labels = np.array([self._role_index[role] for role in roles])
+        onehot = sparse.csr_matrix(
+            (np.ones(len(labels)), (labels, np.arange(len(labels)))),
+            shape=(len(self.roles), len(labels)),
+        )
+        self.feature_sums += (onehot @ tf).toarray()
+        self.document_frequency += np.bincount(tf.indices, minlength=self.n_features)
+        self.class_counts += np.bincount(labels, minlength=len(self.roles))
+        self.rows += len(texts)
+
+    def build(self, alpha: float = 0.1) -> "RoleModel":
+        if not self.rows:
+            raise ValueError("No training rows were provided.")
+
+        idf = np.log((1.0 + self.rows) / (1.0 + self.document_frequency)) + 1.0
+        weighted = self.feature_sums * idf
+        log_likelihood = np.log(weighted + alpha) - np.log(
+            weighted.sum(axis=1, keepdims=True) + alpha * self.n_features
+        )
+        with np.errstate(divide="ignore"):
+            log_prior = np.log(self.class_counts / self.class_counts.sum())
+        # Roles never seen in training can never be predicted.
+        log_prior[self.class_counts == 0] = -np.inf
+
+        digest = hashlib.sha256(log_likelihood.astype(np.float32).tobytes()).hexdigest()[:12]
+        version = f"{timezone.now():%Y%m%d%H%M%S}-{digest}"
+        return RoleModel(
+            roles=self.roles,
+            idf=idf.astype(np.float32),
+            log_likelihood=log_likelihood.astype(np.float32),
+            log_prior=log_prior.astype(np.float32),
+            version=version,
+            trained_rows=self.rows,
+        )
+
+
+class RoleModel:
+    def __init__(self, roles, idf, log_likelihood, log_prior, version: str, trained_rows: int, path: str = ""):
+        self.roles = tuple(roles)
+        self.idf = idf
+        self.log_likelihood = log_likelihood
+        self.log_prior = log_prior
+        self.version = version
+        self.trained_rows = trained_rows
+        self.path = path
+        self.n_features = log_likelihood.shape[1]
+        self._log_likelihood_t = np.ascontiguousarray(log_likelihood.T)
+
+    @property
+    def classifier_version(self) -> str:
+        return f"{MODEL_VERSION_PREFIX}{self.version}"
+
+    def save(self, path: str) -> None:
+        """Write the model atomically as a compressed .npz file."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                np.savez_compressed(
+                    fh,
+                    roles=np.array(self.roles),
+                    idf=self.idf,
+                    log_likelihood=self.log_likelihood,
+                    log_prior=self.log_prior,
+                    version=np.array(self.version),
+                    trained_rows=np.array(self.trained_rows),
+                )
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self.path = str(path)
+
+    @classmethod
+    def load(cls, path: str) -> "RoleModel":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                roles=[str(r) for r in data["roles"]],
+                idf=data["idf"],
+                log_likelihood=data["log_likelihood"],
+                log_prior=data["log_prior"],
+                version=str(data["version"]),
+                trained_rows=int(data["trained_rows"]),
+                path=str(path),
+            )
+
+    def predict_proba(self, texts: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Class probabilities for each text, plus a mask of texts that had at
+        least one feature (empty texts only reflect the prior).
+        """
+        features = term_frequencies(texts, self.n_features).multiply(self.idf).tocsr()
+        joint = np.asarray(features @ self._log_likelihood_t) + self.log_prior
+        joint -= joint.max(axis=1, keepdims=True)
+        probabilities = np.exp(joint)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        return probabilities, np.diff(features.indptr) > 0
+
+    def rank(self, probabilities: np.ndarray, top_k: int) -> List[RoleScore]:
+        order = np.argsort(-probabilities, kind="stable")[:top_k]
+        ranked = [RoleScore(role=self.roles[i], score=round(float(probabilities[i]), 4)) for i in order]
+        return ranked[:1] + [r for r in ranked[1:] if r.score > 0]
+
+    def status(self) -> dict:
+        return {
+            "version": self.version,
+            "path": self.path,
+            "trained_rows": self.trained_rows,
+            "n_features": self.n_features,
+            "file_bytes": os.path.getsize(self.path) if self.path and os.path.exists(self.path) else None,
+        }
+
+
+_model: RoleModel | None = None
+_model_loaded = False
+_model_lock = threading.Lock()
+
+
+def get_role_model() -> RoleModel | None:
+    """Load the trained model once per worker; None if none has been trained."""
+    global _model, _model_loaded
+    if not _model_loaded:
+        with _model_lock:
+            if not _model_loaded:
+                path = settings.PREDICTION_MODEL_PATH
+                _model = RoleModel.load(path) if path and os.path.exists(path) else None
+                _model_loaded = True
+    return _model
+
+
+def iter_training_rows(queryset, chunk_size: int) -> Iterable[tuple[str, str]]:
+    """Yield (text, role) pairs from Prediction rows without loading the table."""
+    rows = queryset.values_list(
+        "resume_text", "resume_blob__text", "input_skills", "predicted_role"
+    ).iterator(chunk_size=chunk_size)
+    for resume_text, blob_text, input_skills, role in rows:
+        resume_text = resume_text or blob_text
+        if isinstance(input_skills, list):
+            text = resume_text or ", ".join(str(s) for s in input_skills)
+        else:
+            text = resume_text
+        if text and role in ALL_ROLES:
+            yield text, role
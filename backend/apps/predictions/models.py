@@ -1,16 +1,110 @@
 from django.conf import settings
 from django.db import models
+
+from core.fields import CompressedTextField
+from core.storage import get_resume_storage
+
 from .constants import ROLE_CHOICES
 
 
+class ResumeBlob(models.Model):
+    """
+    One stored resume per distinct file content (keyed by SHA-256), with the
+    text extracted from it the first time it was classified.
+    """
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to="resumes/", storage=get_resume_storage)
+    size = models.PositiveBigIntegerField(default=0)
+    text = CompressedTextField(blank=True)
+    pages_read = models.PositiveIntegerField(null=True, blank=True)
+    pages_total = models.PositiveIntegerField(null=True, blank=True)
+    truncated = models.BooleanField(default=False)
+    stopped_early = models.BooleanField(default=False)
+    extracted_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.sha256
+
+
+class PredictionManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().defer("resume_text")
+
+
 class Prediction(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="predictions")
     input_skills = models.JSONField(default=dict, blank=True)
-    resume_file = models.FileField(upload_to="resumes/", null=True, blank=True)
-    resume_text = models.TextField(blank=True)
+    resume_file = models.FileField(upload_to="resumes/", storage=get_resume_storage, null=True, blank=True)
+    # Compressed and deferred by default; list queries never load it. Only
+    # filled for rows without a resume_blob (batch and legacy rows): the
+    # blob already holds the extracted text, read it through `text`.
+    resume_text = CompressedTextField(blank=True)
+    resume_blob = models.ForeignKey(
+        ResumeBlob, on_delete=models.SET_NULL, null=True, blank=True, related_name="predictions"
+    )
     predicted_role = models.CharField(max_length=120, choices=ROLE_CHOICES)
     confidence = models.FloatField(null=True, blank=True)
+    rule_version = models.CharField(max_length=64, blank=True, default="")
+    # Compact evidence from the classifier scan; see PredictionSerializer.get_explanation.
+    explanation = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = PredictionManager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at"], name="prediction_created_at_idx"),
+            # History pages: WHERE user_id = ? AND (created_at, id) < cursor.
+            models.Index(fields=["user", "-created_at", "-id"], name="prediction_user_history_idx"),
+        ]
+
+    @property
+    def text(self) -> str:
+        """Resume text, from the shared blob when there is one."""
+        if self.resume_blob_id is not None:
+            return self.resume_blob.text
+        return self.resume_text
+
+
+class ResumeJob(models.Model):
+    """Queued resume upload, processed by `manage.py process_resume_jobs`."""
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+
+    STATUS_CHOICES = (
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    )
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="resume_jobs")
+    resume_file = models.FileField(upload_to="resumes/", storage=get_resume_storage)
+    resume_blob = models.ForeignKey(
+        ResumeBlob, on_delete=models.SET_NULL, null=True, blank=True, related_name="jobs"
+    )
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    prediction = models.OneToOneField(
+        Prediction, on_delete=models.SET_NULL, null=True, blank=True, related_name="resume_job"
+    )
+    error = models.TextField(blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    worker = models.CharField(max_length=64, blank=True)
+    pages_read = models.PositiveIntegerField(null=True, blank=True)
+    pages_total = models.PositiveIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["created_at"]
+        indexes = [
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"Resume job {self.pk} ({self.status})"
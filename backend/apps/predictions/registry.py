@@ -0,0 +1,196 @@
+"""
+Versioned classifier rule registry.
+
+Keyword rules live in a JSON artifact (``PREDICTION_RULES_PATH``). The
+registry compiles the artifact once into the matcher/scorer structures and,
+when the file changes on disk, compiles the new version and swaps it in
+atomically so running workers pick it up without a restart.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+from .constants import is_valid_role
+from .scoring import KeywordScorer
+from .skills import SkillDictionary
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompiledRules:
+    version: str
+    scorer: KeywordScorer
+    skills: SkillDictionary
+    default_role: str
+    default_confidence: float
+    rule_count: int
+    path: str
+    signature: Tuple[int, int]
+    loaded_at: datetime
+    load_seconds: float
+    compile_seconds: float
+
+
+def _parse_rules(document: dict) -> Tuple[str, List[Tuple[str, float, Tuple[str, ...]]], dict, Dict[str, List[str]]]:
+    version = str(document.get("version") or "").strip()
+    if not version:
+        raise ValueError("Rule artifact is missing a 'version'.")
+
+    rules = []
+    for position, rule in enumerate(document.get("rules") or []):
+        role = rule.get("role")
+        confidence = float(rule.get("confidence", 0))
+        keywords = tuple(k.lower() for k in rule.get("keywords") or [] if k)
+        if not is_valid_role(role):
+            raise ValueError(f"Rule {position} has unknown role '{role}'.")
+        if not 0 <= confidence <= 1:
+            raise ValueError(f"Rule {position} confidence must be between 0 and 1.")
+        rules.append((role, confidence, keywords))
+    if not rules:
+        raise ValueError("Rule artifact defines no rules.")
+
+    default = document.get("default") or {}
+    if not is_valid_role(default.get("role")):
+        raise ValueError("Rule artifact needs a valid default role.")
+
+    aliases = {}
+    for canonical, names in (document.get("aliases") or {}).items():
+        if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+            raise ValueError(f"Aliases for '{canonical}' must be a list of strings.")
+        aliases[canonical.lower()] = [n.lower() for n in names]
+    return version, rules, default, aliases
+
+
+def load_rules(path: str) -> CompiledRules:
+    """Read, validate and compile a rule artifact."""
+    started = time.perf_counter()
+    stat = os.stat(path)
+    with open(path, "r", encoding="utf-8") as fh:
+        document = json.load(fh)
+    version, rules, default, aliases = _parse_rules(document)
+    loaded = time.perf_counter()
+
+    scorer = KeywordScorer(rules, aliases=aliases)
+    skills = SkillDictionary(aliases, keywords=scorer.vocabulary)
+    compiled = time.perf_counter()
+
+    return CompiledRules(
+        version=version,
+        scorer=scorer,
+        skills=skills,
+        default_role=default["role"],
+        default_confidence=float(default.get("confidence", 0)),
+        rule_count=len(rules),
+        path=str(path),
+        signature=(stat.st_mtime_ns, stat.st_size),
+        loaded_at=timezone.now(),
+        load_seconds=loaded - started,
+        compile_seconds=compiled - loaded,
+    )
+
+
+class RuleRegistry:
+    """
+    Holds the active compiled rules and hot-reloads them when the artifact
+    changes. Readers never block: they take a reference to the current
+    ``CompiledRules`` and the reload path replaces that reference in one step.
+    """
+
+    def __init__(self, path: str, check_interval: float = 5.0):
+        self.path = str(path)
+        self.check_interval = check_interval
+        self._active: CompiledRules | None = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        self.reload_count = 0
+        self.last_error: str | None = None
+        self._failed_signature: Tuple[int, int] | None = None
+
+    def get(self) -> CompiledRules:
+        """Return the active rules, picking up a changed artifact if due."""
+        if self._active is None or time.monotonic() >= self._next_check:
+            self._refresh()
+        return self._active
+
+    def reload(self) -> CompiledRules:
+        """Force a reload regardless of the check interval."""
+        self._refresh(force=True)
+        return self._active
+
+    def _refresh(self, force: bool = False) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._active is not None and now < self._next_check:
+                return
+            self._next_check = now + self.check_interval
+
+            active = self._active
+            signature = None
+            try:
+                stat = os.stat(self.path)
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if not force and active is not None and signature in (active.signature, self._failed_signature):
+                    return
+                compiled = load_rules(self.path)
+            except (OSError, ValueError, TypeError, AttributeError) as exc:
+                self.last_error = str(exc)
+                self._failed_signature = signature
+                if active is None:
+                    raise ImproperlyConfigured(f"Could not load classifier rules from {self.path}: {exc}") from exc
+                logger.exception("Keeping classifier rules %s; reload failed", active.version)
+                return
+
+            self._active = compiled
+            self.reload_count += 1
+            self.last_error = None
+            self._failed_signature = None
+            logger.info(
+                "Loaded classifier rules %s (load %.1f ms, compile %.1f ms)",
+                compiled.version, compiled.load_seconds * 1000, compiled.compile_seconds * 1000,
+            )
+
+    def status(self) -> dict:
+        active = self.get()
+        return {
+            "version": active.version,
+            "path": active.path,
+            "rule_count": active.rule_count,
+            "keyword_count": len(active.scorer.vocabulary),
+            "alias_count": len(active.scorer.alias_keywords),
+            "skill_dictionary_size": len(active.skills),
+            "loaded_at": active.loaded_at,
+            "load_ms": round(active.load_seconds * 1000, 3),
+            "compile_ms": round(active.compile_seconds * 1000, 3),
+            "reload_count": self.reload_count,
+            "last_error": self.last_error,
+        }
+
+
+_registry: RuleRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_rule_registry() -> RuleRegistry:
+    """Process-wide registry configured from settings."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = RuleRegistry(
+                    settings.PREDICTION_RULES_PATH,
+                    check_interval=settings.PREDICTION_RULES_CHECK_INTERVAL,
+                )
+    return _registry
@@ -1,6 +1,10 @@
+from django.conf import settings
+from django.utils import timezone
+from django.utils.functional import cached_property
 from rest_framework import serializers
-from .models import Prediction
-from .constants import ALL_ROLES, is_valid_role
+from .models import Prediction, ResumeJob
+from .constants import ALL_ROLES, get_role_category, is_valid_role
+from .services import canonicalize_skills
 
 
 class SkillPredictionRequestSerializer(serializers.Serializer):
@@ -16,14 +20,110 @@ class SkillPredictionRequestSerializer(serializers.Serializer):
         allow_empty=False
     )
 
+    def validate_skills(self, value):
+        """Normalize aliases ("ReactJS", "k8s") to canonical skill IDs."""
+        return canonicalize_skills(value)
+
+
+class BatchPredictionItemSerializer(serializers.Serializer):
+    """
+    One batch entry, either a skills list or a free-text blob:
+    {"skills": ["python", "django"]} or {"text": "5 years building APIs ..."}
+    """
+    skills = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        allow_empty=False
+    )
+    text = serializers.CharField(required=False, allow_blank=False)
+
+    def validate_skills(self, value):
+        return canonicalize_skills(value)
+
+    def validate(self, attrs):
+        if ("skills" in attrs) == ("text" in attrs):
+            raise serializers.ValidationError("Provide exactly one of 'skills' or 'text'.")
+        return attrs
+
+
+class BatchPredictionRequestSerializer(serializers.Serializer):
+    """
+    Accepts:
+    {
+        "items": [{"skills": [...]}, {"text": "..."}]
+    }
+    Items are validated individually by the view so one bad entry does not
+    fail the whole batch.
+    """
+    items = serializers.ListField(
+        child=serializers.JSONField(),
+        required=True,
+        allow_empty=False
+    )
+
+    def validate_items(self, value):
+        max_items = settings.PREDICTION_BATCH_MAX_ITEMS
+        if len(value) > max_items:
+            raise serializers.ValidationError(f"A batch may contain at most {max_items} items.")
+        return value
+
 
 class ResumeUploadSerializer(serializers.Serializer):
     resume = serializers.FileField(required=True)
 
 
+class PredictionExportQuerySerializer(serializers.Serializer):
+    """Query parameters of the prediction export (``output`` avoids DRF's ``format``)."""
+    output = serializers.ChoiceField(choices=("csv", "ndjson"), default="csv")
+    gzip = serializers.BooleanField(default=False)
+    since = serializers.DateField(required=False)
+    until = serializers.DateField(required=False)
+    role = serializers.ListField(child=serializers.CharField(), required=False)
+    user = serializers.CharField(required=False)
+
+    def validate(self, attrs):
+        if attrs.get("since") and attrs.get("until") and attrs["since"] > attrs["until"]:
+            raise serializers.ValidationError({"until": "Must not be before since."})
+        return attrs
+
+
+class RoleScoreSerializer(serializers.Serializer):
+    """Ranked alternative role returned alongside a prediction."""
+    role = serializers.CharField()
+    score = serializers.FloatField()
+
+
+def expand_explanation(compact):
+    """
+    Expand the stored compact evidence. Offsets index into the resume
+    text, the submitted text blob, or ``", ".join(input_skills)``.
+    """
+    if not compact:
+        return None
+    if compact.get("src") == "model":
+        return {
+            "source": "model",
+            "contributions": [{"role": role, "score": score} for role, score in compact.get("r", [])],
+        }
+    return {
+        "source": "rules",
+        "match_count": compact.get("n", 0),
+        "matches": [
+            {"keyword": keyword, "start": start, "end": end}
+            for keyword, start, end in compact.get("m", [])
+        ],
+        "contributions": [
+            {"role": role, "score": score, "keywords": keywords}
+            for role, score, keywords in compact.get("r", [])
+        ],
+    }
+
+
 class PredictionSerializer(serializers.ModelSerializer):
     # Add role category for frontend display
     role_category = serializers.SerializerMethodField()
+    # Only included when the view passes explain=True in the context (?explain=1)
+    explanation = serializers.SerializerMethodField()
     
     class Meta:
         model = Prediction
@@ -33,20 +133,152 @@ class PredictionSerializer(serializers.ModelSerializer):
             "predicted_role",
             "role_category",
             "confidence",
+            "rule_version",
             "resume_file",
             "created_at",
+            "explanation",
         )
-        read_only_fields = ("id", "created_at", "role_category")
+        read_only_fields = ("id", "created_at", "role_category", "rule_version", "explanation")
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if not self.context.get("explain"):
+            data.pop("explanation", None)
+        return data
     
     def get_role_category(self, obj):
         """Return the category of the predicted role."""
-        from .constants import get_role_category
         return get_role_category(obj.predicted_role)
     
+    def get_explanation(self, obj):
+        return expand_explanation(obj.explanation)
+
     def validate_predicted_role(self, value):
         """Validate that the predicted role is in our allowed list."""
         if not is_valid_role(value):
             raise serializers.ValidationError(
                 f"Invalid role '{value}'. Must be one of: {', '.join(ALL_ROLES)}"
             )
-        return value
\ No newline at end of file
+        return value
+
+
+class PredictionListSerializer(serializers.BaseSerializer):
+    """
+    Read-only twin of PredictionSerializer for history lists. Rows come from
+    ``.values(*PredictionListSerializer.columns(...))`` and are turned into the
+    same payload with plain dict work instead of per-field serializer calls.
+
+    ``fields`` in the context limits the output to those fields (and the
+    query to the columns they need); ``expand`` adds optional sections.
+    """
+
+    # Output field -> columns it is built from, in response order.
+    FIELDS = {
+        "id": ("id",),
+        "input_skills": ("input_skills",),
+        "predicted_role": ("predicted_role",),
+        "role_category": ("predicted_role",),
+        "confidence": ("confidence",),
+        "rule_version": ("rule_version",),
+        "resume_file": ("resume_file",),
+        "created_at": ("created_at",),
+    }
+    EXPANSIONS = {
+        "explanation": ("explanation",),
+        "user": ("user_id", "user__username", "user__email"),
+    }
+
+    @classmethod
+    def parse_selection(cls, fields_param=None, expand_param=None):
+        """``?fields=a,b`` / ``?expand=c`` -> (fields, expansions); raises ValidationError for unknown names."""
+        def split(value):
+            return [name.strip() for name in (value or "").split(",") if name.strip()]
+
+        fields, expand = split(fields_param), split(expand_param)
+        errors = {}
+        unknown = [name for name in fields if name not in cls.FIELDS]
+        if unknown:
+            errors["fields"] = f"Unknown fields: {', '.join(unknown)}. Choose from: {', '.join(cls.FIELDS)}."
+        unknown = [name for name in expand if name not in cls.EXPANSIONS]
+        if unknown:
+            errors["expand"] = f"Unknown expansions: {', '.join(unknown)}. Choose from: {', '.join(cls.EXPANSIONS)}."
+        if errors:
+            raise serializers.ValidationError(errors)
+        # Keep response order stable whatever order the client asked in.
+        fields = tuple(name for name in cls.FIELDS if name in fields) or tuple(cls.FIELDS)
+        expand = tuple(name for name in cls.EXPANSIONS if name in expand)
+        return fields, expand
+
+    @classmethod
+    def columns(cls, fields=None, expand=()):
+        """Columns to select for ``fields`` (default: all) and ``expand``."""
+        names = [column for name in fields or cls.FIELDS for column in cls.FIELDS[name]]
+        names += [column for name in expand for column in cls.EXPANSIONS[name]]
+        return tuple(dict.fromkeys(names))
+
+    @cached_property
+    def _timezone(self):
+        # Looked up once per list; DateTimeField resolves it for every row.
+        return timezone.get_current_timezone()
+
+    def _format_datetime(self, value):
+        value = value.astimezone(self._timezone).isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+    def _file_url(self, name):
+        if not name:
+            return None
+        url = Prediction._meta.get_field("resume_file").storage.url(name)
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request is not None else url
+
+    @cached_property
+    def _selection(self):
+        fields = self.context.get("fields") or tuple(self.FIELDS)
+        expand = tuple(self.context.get("expand") or ())
+        if self.context.get("explain") and "explanation" not in expand:
+            expand += ("explanation",)
+        return fields, expand
+
+    def to_representation(self, row):
+        fields, expand = self._selection
+        data = {}
+        for name in fields:
+            if name == "role_category":
+                data[name] = get_role_category(row["predicted_role"])
+            elif name == "resume_file":
+                data[name] = self._file_url(row["resume_file"])
+            elif name == "created_at":
+                data[name] = self._format_datetime(row["created_at"])
+            else:
+                data[name] = row[name]
+        if "user" in expand:
+            data["user"] = {"id": row["user_id"], "username": row["user__username"], "email": row["user__email"]}
+        if "explanation" in expand:
+            data["explanation"] = expand_explanation(row["explanation"])
+        return data
+
+
+class ResumeJobSerializer(serializers.ModelSerializer):
+    prediction = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ResumeJob
+        fields = (
+            "id",
+            "status",
+            "attempts",
+            "error",
+            "pages_read",
+            "pages_total",
+            "created_at",
+            "started_at",
+            "finished_at",
+            "prediction",
+        )
+        read_only_fields = fields
+
+    def get_prediction(self, obj):
+        if obj.prediction_id is None:
+            return None
+        return PredictionSerializer(obj.prediction, context=self.context).data
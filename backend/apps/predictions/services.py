@@ -1,86 +1,292 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from .constants import (
-    ALL_ROLES, 
-    TECHNICAL_ROLES, 
-    NON_TECHNICAL_ROLES,
-    normalize_legacy_role
-)
+import time
+from dataclasses import dataclass, field
+from typing import List, Sequence
+
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+
+from core.pdf_sandbox import PdfSandboxPool, open_pdf_pages
+
+from .constants import ROLE_SET, normalize_legacy_role
+from .cache import get_prediction_cache, skills_cache_key
+from .matcher import KeywordMatch
+from .model import RoleModel, get_role_model
+from .models import ResumeBlob
+from .registry import CompiledRules, get_rule_registry
+from .scoring import RoleScore
 
 
 @dataclass
 class PredictionResult:
     role: str
     confidence: float | None = None
+    alternatives: List[RoleScore] = field(default_factory=list)
+    rule_version: str = ""
+    explanation: dict | None = None
+
+
+def _result_from_scores(rules: CompiledRules, scores, top_k: int, matches: Sequence[KeywordMatch] = ()) -> PredictionResult:
+    scorer = rules.scorer
+    explanation = scorer.explain(matches, scores, settings.PREDICTION_EXPLAIN_MAX_MATCHES)
+    ranked = scorer.rank(scores, top_k)
+    if not ranked:
+        # Default fallback
+        return PredictionResult(
+            role=rules.default_role,
+            confidence=rules.default_confidence,
+            rule_version=rules.version,
+            explanation=explanation,
+        )
+
+    return PredictionResult(
+        role=ranked[0].role,
+        confidence=scorer.confidence_for(ranked, matches),
+        alternatives=ranked,
+        rule_version=rules.version,
+        explanation=explanation,
+    )
+
+
+def _model_results(model: RoleModel | None, texts: Sequence[str], top_k: int) -> List[PredictionResult | None]:
+    """Model predictions, or None for each text the model is not confident about."""
+    results: List[PredictionResult | None] = [None] * len(texts)
+    if model is None:
+        return results
+
+    probabilities, has_features = model.predict_proba(texts)
+    for index, (row, known) in enumerate(zip(probabilities, has_features)):
+        if known and row.max() >= settings.PREDICTION_MODEL_MIN_CONFIDENCE:
+            ranked = model.rank(row, top_k)
+            results[index] = PredictionResult(
+                role=ranked[0].role,
+                confidence=ranked[0].score,
+                alternatives=ranked,
+                rule_version=model.classifier_version,
+                explanation={"src": "model", "r": [[r.role, r.score] for r in ranked]},
+            )
+    return results
+
 
+def _classify_texts(rules: CompiledRules, model: RoleModel | None, texts: Sequence[str], top_k: int) -> List[PredictionResult]:
+    """
+    Use the trained model where it is confident and fall back to the keyword
+    rules for everything else. Both paths score all texts in one matrix
+    product.
+    """
+    results = _model_results(model, texts, top_k)
+
+    pending = [index for index, result in enumerate(results) if result is None]
+    if pending:
+        # The same scan feeds both the score matrix and the explanations.
+        matches = [rules.scorer.scan(texts[i]) for i in pending]
+        scores = rules.scorer.score_matrix(rules.scorer.count_matrix(matches))
+        for index, row, text_matches in zip(pending, scores, matches):
+            results[index] = _result_from_scores(rules, row, top_k, text_matches)
+    return results
+
+
+def _classifier_version(rules: CompiledRules, model: RoleModel | None) -> str:
+    """Identifies the rules (and model, if loaded) serving a prediction."""
+    return f"{rules.version}+{model.classifier_version}" if model else rules.version
 
-def predict_role_from_text(text: str) -> PredictionResult:
+
+def predict_role_from_text(text: str, top_k: int | None = None) -> PredictionResult:
     """
     Enhanced prediction logic supporting both technical and non-technical roles.
-    Uses keyword-based heuristics with fallback to ensure no crashes.
+    Uses the trained model when one is available and confident, otherwise
+    scores every role with one keyword-weight matrix product. Returns the
+    best role together with the ranked top-k alternatives.
     """
-    normalized = (text or "").lower()
-    
-    # Technical role predictions
-    if any(k in normalized for k in ["react", "javascript", "frontend", "css", "tailwind", "html", "vue", "angular"]):
-        return PredictionResult(role="Frontend Developer", confidence=0.75)
-    
-    if any(k in normalized for k in ["django", "rest framework", "python", "api", "backend", "flask", "fastapi"]):
-        return PredictionResult(role="Backend Developer", confidence=0.75)
-    
-    if any(k in normalized for k in ["web", "website", "fullstack", "full stack", "full-stack"]):
-        return PredictionResult(role="Web Developer", confidence=0.75)
-    
-    if any(k in normalized for k in ["ml", "machine learning", "sklearn", "pytorch", "tensorflow", "keras", "nlp"]):
-        return PredictionResult(role="ML Engineer", confidence=0.80)
-    
-    if any(k in normalized for k in ["data science", "statistics", "pandas", "numpy", "jupyter", "analytics", "visualization"]):
-        return PredictionResult(role="Data Scientist", confidence=0.75)
-    
-    if any(k in normalized for k in ["docker", "kubernetes", "aws", "azure", "gcp", "ci/cd", "jenkins", "devops"]):
-        return PredictionResult(role="DevOps Engineer", confidence=0.70)
-    
-    # Non-technical role predictions
-    if any(k in normalized for k in ["product", "roadmap", "strategy", "user stories", "agile", "scrum", "backlog"]):
-        return PredictionResult(role="Product Manager", confidence=0.70)
-    
-    if any(k in normalized for k in ["business", "requirements", "process", "workflow", "optimization", "stakeholder"]):
-        return PredictionResult(role="Business Analyst", confidence=0.65)
-    
-    if any(k in normalized for k in ["project", "timeline", "budget", "resources", "management", "coordination"]):
-        return PredictionResult(role="Project Manager", confidence=0.65)
-    
-    if any(k in normalized for k in ["marketing", "campaign", "seo", "social media", "content", "brand", "analytics"]):
-        return PredictionResult(role="Marketing Analyst", confidence=0.60)
-    
-    if any(k in normalized for k in ["hr", "recruitment", "hiring", "employee", "training", "performance", "culture"]):
-        return PredictionResult(role="HR Manager", confidence=0.60)
-    
-    if any(k in normalized for k in ["operations", "logistics", "supply chain", "efficiency", "process improvement"]):
-        return PredictionResult(role="Operations Manager", confidence=0.60)
-    
-    if any(k in normalized for k in ["sales", "revenue", "clients", "deals", "negotiation", "crm", "prospecting"]):
-        return PredictionResult(role="Sales Executive", confidence=0.65)
-    
-    if any(k in normalized for k in ["ui", "ux", "design", "figma", "prototype", "wireframe", "user experience"]):
-        return PredictionResult(role="UI/UX Designer", confidence=0.70)
-    
-    if any(k in normalized for k in ["content", "writing", "blog", "social", "editorial", "copywriting"]):
-        return PredictionResult(role="Content Strategist", confidence=0.60)
-    
-    if any(k in normalized for k in ["customer", "support", "success", "retention", "satisfaction", "service"]):
-        return PredictionResult(role="Customer Success Manager", confidence=0.65)
-    
-    # Fallback prediction - choose based on dominant indicators
-    if any(k in normalized for k in ["technical", "programming", "code", "software", "development"]):
-        return PredictionResult(role="Web Developer", confidence=0.50)
-    
-    if any(k in normalized for k in ["management", "leadership", "strategy", "planning"]):
-        return PredictionResult(role="Project Manager", confidence=0.50)
-    
-    # Default fallback
-    return PredictionResult(role="Business Analyst", confidence=0.40)
+    if top_k is None:
+        top_k = settings.PREDICTION_TOP_K
+
+    return _classify_texts(get_rule_registry().get(), get_role_model(), [text], top_k)[0]
+
+
+def predict_role_from_skills(skills: Sequence[str], top_k: int | None = None) -> PredictionResult:
+    """
+    Predict from a skills list through the LRU cache. Reordered, repeated or
+    aliased ("ReactJS", "react.js") skills share one cache entry; entries from an older classifier version miss.
+    """
+    if top_k is None:
+        top_k = settings.PREDICTION_TOP_K
+
+    rules = get_rule_registry().get()
+    model = get_role_model()
+    version = _classifier_version(rules, model)
+    canonical = rules.skills.canonicalize(skills)
+    key = skills_cache_key(canonical, top_k)
+    cache = get_prediction_cache()
+
+    result = cache.get(key, version)
+    if result is None:
+        result = _classify_texts(rules, model, [", ".join(canonical)], top_k)[0]
+        cache.set(key, version, result)
+    return result
+
+
+def predict_roles_from_texts(texts: Sequence[str], top_k: int | None = None) -> List[PredictionResult]:
+    """
+    Classify many texts in one pass: every text is scanned once and all of
+    them are scored with a single texts x roles matrix product.
+    """
+    if top_k is None:
+        top_k = settings.PREDICTION_TOP_K
+    if not texts:
+        return []
+
+    return _classify_texts(get_rule_registry().get(), get_role_model(), texts, top_k)
+
+
+class IncrementalClassifier:
+    """
+    Classifies a document page by page. Each page is scanned once as it
+    arrives and its keyword scores are added to a running total, so callers
+    can stop feeding pages once ``is_stable`` reports that the leading role
+    has held for ``PREDICTION_EARLY_EXIT_PAGES`` consecutive pages.
+    """
+
+    def __init__(self, top_k: int | None = None):
+        self.top_k = settings.PREDICTION_TOP_K if top_k is None else top_k
+        self.rules = get_rule_registry().get()
+        self.model = get_role_model()
+        self.scores = np.zeros(len(self.rules.scorer.roles))
+        self.matches: List[KeywordMatch] = []
+        self._parts: List[str] = []
+        self._offset = 0
+        self._leader: str | None = None
+        self._stable_pages = 0
+
+    def feed(self, page_text: str) -> None:
+        scorer = self.rules.scorer
+        if self._parts:
+            self._offset += 1  # the "\n" joining pages in self.text
+        page_matches = [
+            KeywordMatch(keyword=m.keyword, start=m.start + self._offset, end=m.end + self._offset)
+            for m in scorer.scan(page_text)
+        ]
+        self.matches.extend(page_matches)
+        self.scores += scorer.score_matrix(scorer.count_matrix([page_matches]))[0]
+        self._parts.append(page_text)
+        self._offset += len(page_text)
+
+        ranked = scorer.rank(self.scores, 1)
+        leader = ranked[0].role if ranked and ranked[0].score >= settings.PREDICTION_EARLY_EXIT_MIN_SHARE else None
+        self._stable_pages = self._stable_pages + 1 if leader and leader == self._leader else int(bool(leader))
+        self._leader = leader
+
+    @property
+    def is_stable(self) -> bool:
+        required = settings.PREDICTION_EARLY_EXIT_PAGES
+        return bool(required) and self._stable_pages >= required
+
+    @property
+    def text(self) -> str:
+        # Only trailing whitespace is trimmed so match offsets stay valid.
+        return "\n".join(self._parts).rstrip()
+
+    def result(self) -> PredictionResult:
+        model_result = _model_results(self.model, [self.text], self.top_k)[0] if self.model else None
+        return model_result or _result_from_scores(self.rules, self.scores, self.top_k, self.matches)
+
+
+@dataclass
+class ResumePrediction:
+    result: PredictionResult
+    text: str
+    pages_read: int
+    pages_total: int
+    truncated: bool
+    stopped_early: bool
+    # True when the text came from a previously extracted ResumeBlob.
+    reused_text: bool = False
+    # Time spent reading pages vs. classifying them (parse-dominated).
+    extract_seconds: float = 0.0
+    classify_seconds: float = 0.0
+
+
+def predict_role_from_resume(file_obj, pool: PdfSandboxPool | None = None) -> ResumePrediction:
+    """
+    Stream a PDF page by page into the incremental classifier, honouring the
+    PDF_MAX_PAGES / PDF_MAX_CHARS caps and stopping once the prediction is
+    stable. Raises ``PdfExtractionError`` if the PDF cannot be read.
+    """
+    classifier = IncrementalClassifier()
+    stopped_early = False
+    classify_seconds = 0.0
+    started = time.perf_counter()
+    with open_pdf_pages(
+        file_obj, max_pages=settings.PDF_MAX_PAGES, max_chars=settings.PDF_MAX_CHARS, pool=pool
+    ) as pages:
+        for page_text in pages:
+            fed = time.perf_counter()
+            classifier.feed(page_text)
+            classify_seconds += time.perf_counter() - fed
+            if classifier.is_stable and pages.pages_read < pages.pages_total:
+                stopped_early = True
+                break
+
+    fed = time.perf_counter()
+    result = classifier.result()
+    finished = time.perf_counter()
+    classify_seconds += finished - fed
+
+    return ResumePrediction(
+        result=result,
+        text=classifier.text,
+        pages_read=pages.pages_read,
+        pages_total=pages.pages_total,
+        truncated=pages.truncated,
+        stopped_early=stopped_early,
+        extract_seconds=finished - started - classify_seconds,
+        classify_seconds=classify_seconds,
+    )
+
+
+def resume_prediction_from_blob(blob: ResumeBlob, result: PredictionResult) -> ResumePrediction:
+    """Wrap a classification of an already-extracted blob's text."""
+    return ResumePrediction(
+        result=result,
+        text=blob.text,
+        pages_read=blob.pages_read,
+        pages_total=blob.pages_total,
+        truncated=blob.truncated,
+        stopped_early=blob.stopped_early,
+        reused_text=True,
+    )
+
+
+def predict_role_from_resume_blob(blob: ResumeBlob) -> ResumePrediction:
+    """
+    Classify a stored resume. The PDF is only parsed the first time a blob is
+    seen; later submissions of the same content re-classify the saved text.
+    """
+    if blob.extracted_at is not None:
+        return resume_prediction_from_blob(blob, predict_role_from_text(blob.text))
+
+    with blob.file.open("rb") as fh:
+        analysis = predict_role_from_resume(fh)
+    ResumeBlob.objects.filter(pk=blob.pk, extracted_at__isnull=True).update(
+        text=analysis.text,
+        pages_read=analysis.pages_read,
+        pages_total=analysis.pages_total,
+        truncated=analysis.truncated,
+        stopped_early=analysis.stopped_early,
+        extracted_at=timezone.now(),
+    )
+    return analysis
+
+
+def canonicalize_skills(skills: Sequence[str]) -> List[str]:
+    """
+    Sorted canonical skill IDs: the list that is stored as ``input_skills``
+    and, joined with ", ", scanned by the classifier, so explanation offsets
+    index into ``", ".join(input_skills)``.
+    """
+    return get_rule_registry().get().skills.canonicalize(skills)
 
 
 def validate_and_normalize_role(role: str) -> str:
@@ -95,7 +301,7 @@ def validate_and_normalize_role(role: str) -> str:
     normalized = normalize_legacy_role(role)
     
     # Validate against allowed roles
-    if normalized in ALL_ROLES:
+    if normalized in ROLE_SET:
         return normalized
     
     # If still not found, return a safe default
@@ -0,0 +1,68 @@
+"""
+Canonical skill dictionary.
+
+Maps spelling variants ("ReactJS", "react.js", "k8s", "scikit learn") to one
+canonical skill ID so skills lists, cache keys and stored predictions all use
+the same vocabulary. Aliases come from the versioned rule artifact.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Mapping
+
+_SEPARATORS_RE = re.compile(r"[\s._-]+")
+
+
+def normalize_skill(skill: str) -> str:
+    """Lowercase and collapse internal whitespace."""
+    return " ".join((skill or "").lower().split())
+
+
+def _squash(skill: str) -> str:
+    # "React.JS", "react-js" and "react js" all squash to "reactjs".
+    return _SEPARATORS_RE.sub("", skill)
+
+
+class SkillDictionary:
+    """
+    Two hash maps built once per rule version: exact normalized spellings,
+    then a separator-insensitive fallback. Unknown skills are kept as their
+    normalized spelling.
+    """
+
+    def __init__(self, aliases: Mapping[str, Iterable[str]], keywords: Iterable[str] = ()):
+        self._exact: Dict[str, str] = {}
+        self._squashed: Dict[str, str] = {}
+
+        for keyword in keywords:
+            self._add(keyword, keyword)
+        for canonical, names in aliases.items():
+            for name in (canonical, *names):
+                self._add(name, canonical)
+
+    def _add(self, name: str, canonical: str) -> None:
+        key = normalize_skill(name)
+        canonical = normalize_skill(canonical)
+        self._exact.setdefault(key, canonical)
+        self._squashed.setdefault(_squash(key), canonical)
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def canonical(self, skill: str) -> str:
+        key = normalize_skill(skill)
+        return self._exact.get(key) or self._squashed.get(_squash(key)) or key
+
+    def normalize(self, skills: Iterable[str]) -> List[str]:
+        """Canonical IDs in submission order, without blanks or duplicates."""
+        seen = {}
+        for skill in skills:
+            canonical = self.canonical(skill)
+            if canonical:
+                seen.setdefault(canonical, None)
+        return list(seen)
+
+    def canonicalize(self, skills: Iterable[str]) -> List[str]:
+        """Sorted canonical IDs; the stable form used for cache keys."""
+        return sorted(self.normalize(skills))
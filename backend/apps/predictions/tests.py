@@ -1,3 +1,139 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.predictions.jobs import claim_next_job, requeue_stale_jobs
+from apps.predictions.matcher import KeywordMatcher
+from apps.predictions.models import Prediction, ResumeJob
+from apps.predictions.registry import get_rule_registry
+from apps.predictions.services import predict_role_from_text
+
+
+class KeywordMatcherTests(TestCase):
+    def keywords(self, matcher, text):
+        return [m.keyword for m in matcher.find_longest(text)]
+
+    def test_matches_only_on_word_boundaries(self):
+        matcher = KeywordMatcher(["ml", "hr"])
+        self.assertEqual(self.keywords(matcher, "html and three"), [])
+        self.assertEqual(self.keywords(matcher, "ml, hr"), ["ml", "hr"])
+
+    def test_prefers_leftmost_longest_match(self):
+        matcher = KeywordMatcher(["react", "react.js", "js"])
+        matches = matcher.find_longest("built with react.js")
+        self.assertEqual([(m.keyword, m.start, m.end) for m in matches], [("react.js", 11, 19)])
+
+    def test_scan_reports_aliases_under_their_keyword(self):
+        scorer = get_rule_registry().get().scorer
+        self.assertEqual([m.keyword for m in scorer.scan("React.js and ReactJS")], ["react", "react"])
+
+
+@mock.patch("apps.predictions.services.get_role_model", return_value=None)
+class RuleConfidenceTests(TestCase):
+    def test_fallback_rules_keep_their_own_confidence(self, _):
+        leadership = predict_role_from_text("leadership")
+        self.assertEqual((leadership.role, leadership.confidence), ("Project Manager", 0.5))
+        programming = predict_role_from_text("programming")
+        self.assertEqual((programming.role, programming.confidence), ("Web Developer", 0.5))
+
+    def test_main_rule_hit_outranks_fallback_confidence(self, _):
+        result = predict_role_from_text("management and leadership")
+        self.assertEqual((result.role, result.confidence), ("Project Manager", 0.65))
+
+    def test_no_match_uses_default(self, _):
+        result = predict_role_from_text("nothing relevant here")
+        self.assertEqual((result.role, result.confidence), ("Business Analyst", 0.4))
+
+
+class PredictionAPITestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="alice", email="alice@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+
+class BatchPredictionTests(PredictionAPITestCase):
+    def test_invalid_items_are_reported_without_failing_the_batch(self):
+        response = self.client.post(
+            "/api/predictions/batch/",
+            {"items": [{"skills": ["python", "django"]}, {}, {"text": "react and css"}, {"skills": [], "text": "x"}]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data["count"], response.data["created"], response.data["failed"]), (4, 2, 2))
+        self.assertEqual([r["status"] for r in response.data["results"]], ["ok", "invalid", "ok", "invalid"])
+        self.assertEqual(Prediction.objects.filter(user=self.user).count(), 2)
+
+
+class FieldSelectionTests(PredictionAPITestCase):
+    def test_expand_explanation_works_like_explain_on_create(self):
+        for query in ("?explain=1", "?expand=explanation"):
+            response = self.client.post(f"/api/predictions/skills/{query}", {"skills": ["python"]}, format="json")
+            self.assertEqual(response.status_code, 200)
+            self.assertIsNotNone(response.data["explanation"])
+
+    def test_unsupported_selection_on_create_is_rejected(self):
+        for query in ("?fields=id", "?expand=user"):
+            response = self.client.post(f"/api/predictions/skills/{query}", {"skills": ["python"]}, format="json")
+            self.assertEqual(response.status_code, 400)
+        self.assertFalse(Prediction.objects.exists())
+
+
+class HistoryPaginationTests(PredictionAPITestCase):
+    def create(self, count):
+        return [Prediction.objects.create(user=self.user, predicted_role="Data Scientist").pk for _ in range(count)]
+
+    def test_pages_are_stable_under_concurrent_inserts(self):
+        ids = self.create(5)
+        first = self.client.get("/api/predictions/history/", {"page_size": 2})
+        self.assertEqual([row["id"] for row in first.data["results"]], ids[::-1][:2])
+
+        self.create(3)  # newer rows arrive while the client pages
+        second = self.client.get(first.data["next"])
+        third = self.client.get(second.data["next"])
+        self.assertEqual([row["id"] for row in second.data["results"]], ids[::-1][2:4])
+        self.assertEqual([row["id"] for row in third.data["results"]], ids[::-1][4:])
+        self.assertIsNone(third.data["next"])
+
+        previous = self.client.get(third.data["previous"])
+        self.assertEqual([row["id"] for row in previous.data["results"]], ids[::-1][2:4])
+
+    def test_invalid_cursor_is_not_found(self):
+        response = self.client.get("/api/predictions/history/", {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(RESUME_JOB_MAX_ATTEMPTS=2)
+class ResumeJobQueueTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="bob", email="bob@example.com", password="x")
+
+    def job(self, **fields):
+        return ResumeJob.objects.create(user=self.user, resume_file="resumes/cv.pdf", **fields)
+
+    def test_claims_oldest_queued_job_once(self):
+        first, second = self.job(), self.job()
+        self.job(status=ResumeJob.STATUS_DONE)
+
+        claimed = claim_next_job("worker-1")
+        self.assertEqual(claimed.pk, first.pk)
+        self.assertEqual((claimed.status, claimed.worker, claimed.attempts), (ResumeJob.STATUS_RUNNING, "worker-1", 1))
+        self.assertEqual(claim_next_job("worker-2").pk, second.pk)
+        self.assertIsNone(claim_next_job("worker-3"))
+
+    def test_requeues_stale_jobs_until_attempts_run_out(self):
+        long_ago = timezone.now() - timedelta(hours=1)
+        retry = self.job(status=ResumeJob.STATUS_RUNNING, worker="dead", attempts=1, started_at=long_ago)
+        exhausted = self.job(status=ResumeJob.STATUS_RUNNING, worker="dead", attempts=2, started_at=long_ago)
+        fresh = self.job(status=ResumeJob.STATUS_RUNNING, worker="alive", attempts=1, started_at=timezone.now())
+
+        self.assertEqual(requeue_stale_jobs(timedelta(minutes=10)), 2)
+        for job in (retry, exhausted, fresh):
+            job.refresh_from_db()
+        self.assertEqual((retry.status, retry.worker), (ResumeJob.STATUS_QUEUED, ""))
+        self.assertEqual(exhausted.status, ResumeJob.STATUS_FAILED)
+        self.assertEqual(fresh.status, ResumeJob.STATUS_RUNNING)
@@ -1,11 +1,17 @@
 from django.urls import path
 
-from .views import PredictionHistoryView, PredictFromResumeView, PredictFromSkillsView, AllPredictionHistoryView, PredictionListCreateAPIView
+from .views import PredictionEngineStatusView, PredictionExportView, PredictionResumeDownloadView, PredictionHistoryView, PredictionStatsView, PredictBatchView, PredictFromResumeView, PredictFromSkillsView, AllPredictionHistoryView, PredictionListCreateAPIView, ResumeJobStatusView
 
 urlpatterns = [
     path("", PredictionListCreateAPIView.as_view(), name="prediction-list-create"),
     path("skills/", PredictFromSkillsView.as_view(), name="predict-skills"),
     path("resume/", PredictFromResumeView.as_view(), name="predict-resume"),
+    path("resume/jobs/<int:job_id>/", ResumeJobStatusView.as_view(), name="resume-job-status"),
+    path("batch/", PredictBatchView.as_view(), name="predict-batch"),
+    path("<int:pk>/resume/", PredictionResumeDownloadView.as_view(), name="prediction-resume-download"),
     path("history/", PredictionHistoryView.as_view(), name="prediction-history"),
+    path("stats/", PredictionStatsView.as_view(), name="prediction-stats"),
     path("all-history/", AllPredictionHistoryView.as_view(), name="all-prediction-history"),
+    path("export/", PredictionExportView.as_view(), name="prediction-export"),
+    path("engine/status/", PredictionEngineStatusView.as_view(), name="prediction-engine-status"),
 ]
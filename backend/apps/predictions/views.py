@@ -1,21 +1,129 @@
 from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import Avg, Count, Q
+from django.http import Http404, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.http import content_disposition_header
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
+from django.utils.functional import cached_property
 
-from core.utils import extract_text_from_pdf
+from apps.analytics.rollups import record_predictions
+from core.pagination import KeysetPagination
+from core.pdf_sandbox import PdfExtractionError, pdf_sandbox_stats
+from core.permissions import IsAdminRole
+from core.storage import file_download_response
 
-from .models import Prediction
+from .blobs import store_resume_blob
+from .exports import EXPORT_FORMATS, export_filename, export_queryset, stream_export
+from .jobs import enqueue_resume_job
+from .models import Prediction, ResumeJob
 from .serializers import (
+    BatchPredictionItemSerializer,
+    BatchPredictionRequestSerializer,
+    PredictionExportQuerySerializer,
+    PredictionListSerializer,
     PredictionSerializer,
+    ResumeJobSerializer,
     ResumeUploadSerializer,
+    RoleScoreSerializer,
     SkillPredictionRequestSerializer,
 )
-from .services import predict_role_from_text
+from .cache import get_prediction_cache
+from .model import get_role_model
+from .registry import get_rule_registry
+from .services import predict_role_from_resume_blob, predict_role_from_skills, predict_roles_from_texts
+
+
+def wants_explanation(request) -> bool:
+    """Evidence is opt-in via ?explain=1 or ?expand=explanation so default responses stay small."""
+    expand = [name.strip() for name in request.query_params.get("expand", "").split(",")]
+    return request.query_params.get("explain", "").lower() in ("1", "true", "yes") or "explanation" in expand
+
+
+def explanation_context(request) -> dict:
+    """
+    Serializer context for endpoints that return whole predictions. Only
+    the explanation can be requested there; ``?fields=`` and other
+    expansions are rejected instead of being silently ignored.
+    """
+    params = request.query_params
+    errors = {}
+    if "fields" in params:
+        errors["fields"] = "?fields= is only supported on the prediction history lists."
+    unsupported = [
+        name.strip() for name in params.get("expand", "").split(",") if name.strip() not in ("", "explanation")
+    ]
+    if unsupported:
+        errors["expand"] = f"Unsupported expansions: {', '.join(unsupported)}. Only 'explanation' is supported here."
+    if errors:
+        raise ValidationError(errors)
+    return {"explain": wants_explanation(request)}
+
+
+def wants_async(request) -> bool:
+    """?async=1/0 overrides the PREDICTION_RESUME_ASYNC default."""
+    value = request.query_params.get("async", "").lower()
+    if value in ("1", "true", "yes"):
+        return True
+    if value in ("0", "false", "no"):
+        return False
+    return settings.PREDICTION_RESUME_ASYNC
+
+
+class ExplainableListMixin:
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request.method == "GET":
+            context["explain"] = wants_explanation(self.request)
+        else:
+            context.update(explanation_context(self.request))
+        return context
+
+
+class PredictionListMixin(ExplainableListMixin):
+    """
+    GET lists read plain rows with ``.values()`` and serialize them with
+    PredictionListSerializer; other methods keep the full serializer.
+    ``?fields=`` and ``?expand=`` narrow both the payload and the SELECT.
+    """
+
+    @cached_property
+    def field_selection(self):
+        params = self.request.query_params
+        fields, expand = PredictionListSerializer.parse_selection(params.get("fields"), params.get("expand"))
+        if wants_explanation(self.request) and "explanation" not in expand:
+            expand += ("explanation",)
+        return fields, expand
+
+    def get_serializer_class(self):
+        if self.request.method == "GET":
+            return PredictionListSerializer
+        return super().get_serializer_class()
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request.method == "GET":
+            context["fields"], context["expand"] = self.field_selection
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method == "GET":
+            fields, expand = self.field_selection
+            # id and created_at are always read: the paginator's cursor is built from them.
+            columns = PredictionListSerializer.columns(fields, expand)
+            queryset = queryset.values(*dict.fromkeys(columns + ("id", "created_at")))
+        return queryset
 
 
 @method_decorator(csrf_exempt, name='dispatch')
@@ -24,25 +132,27 @@ class PredictFromSkillsView(APIView):
     permission_classes = [IsAuthenticated]
     
     def post(self, request, *args, **kwargs):
+        context = explanation_context(request)
         serializer = SkillPredictionRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         skills = serializer.validated_data.get("skills", [])
-        text = " ".join(skills)
+        result = predict_role_from_skills(skills)
 
-        result = predict_role_from_text(text)
+        # Atomic so the analytics counters commit together with the row.
+        with transaction.atomic():
+            prediction = Prediction.objects.create(
+                user=request.user,
+                input_skills=skills,
+                predicted_role=result.role,
+                confidence=result.confidence,
+                rule_version=result.rule_version,
+                explanation=result.explanation,
+            )
 
-        prediction = Prediction.objects.create(
-            user=request.user,
-            input_skills=skills,
-            predicted_role=result.role,
-            confidence=result.confidence,
-        )
-
-        return Response(
-            PredictionSerializer(prediction).data,
-            status=200
-        )
+        data = PredictionSerializer(prediction, context=context).data
+        data["alternatives"] = RoleScoreSerializer(result.alternatives, many=True).data
+        return Response(data, status=200)
 
 
 @method_decorator(csrf_exempt, name='dispatch')
@@ -52,40 +162,174 @@ class PredictFromResumeView(APIView):
     parser_classes = [MultiPartParser, FormParser]
 
     def post(self, request):
-        print("User:", request.user)
-        print("Authenticated:", request.user.is_authenticated)
-        print("Data:", request.data)
-        
+        context = explanation_context(request)
         serializer = ResumeUploadSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         resume = serializer.validated_data["resume"]
-        resume_text = extract_text_from_pdf(resume)
-        result = predict_role_from_text(resume_text)
-
-        prediction = Prediction.objects.create(
-            user=request.user,
-            resume_file=resume,
-            resume_text=resume_text,
-            predicted_role=result.role,
-            confidence=result.confidence,
+        if wants_async(request):
+            job = enqueue_resume_job(request.user, resume)
+            return Response(
+                {
+                    "job_id": job.id,
+                    "status": job.status,
+                    "status_url": reverse("resume-job-status", kwargs={"job_id": job.id}),
+                },
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        blob, _ = store_resume_blob(resume)
+        try:
+            analysis = predict_role_from_resume_blob(blob)
+        except PdfExtractionError as exc:
+            code = (
+                status.HTTP_503_SERVICE_UNAVAILABLE if exc.reason == "busy"
+                else status.HTTP_422_UNPROCESSABLE_ENTITY
+            )
+            return Response({"detail": str(exc), "reason": exc.reason}, status=code)
+        result = analysis.result
+
+        with transaction.atomic():
+            prediction = Prediction.objects.create(
+                user=request.user,
+                resume_file=blob.file.name,
+                resume_blob=blob,
+                predicted_role=result.role,
+                confidence=result.confidence,
+                rule_version=result.rule_version,
+                explanation=result.explanation,
+            )
+        data = PredictionSerializer(prediction, context=context).data
+        data["alternatives"] = RoleScoreSerializer(result.alternatives, many=True).data
+        data["extraction"] = {
+            "pages_read": analysis.pages_read,
+            "pages_total": analysis.pages_total,
+            "truncated": analysis.truncated,
+            "stopped_early": analysis.stopped_early,
+            "reused_text": analysis.reused_text,
+        }
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+class ResumeJobStatusView(APIView):
+    """Poll an asynchronous resume job; includes the Prediction once done."""
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, job_id):
+        job = get_object_or_404(
+            ResumeJob.objects.select_related("prediction"), id=job_id, user=request.user
         )
-        return Response(PredictionSerializer(prediction).data, status=status.HTTP_201_CREATED)
+        return Response(ResumeJobSerializer(job, context=explanation_context(request)).data)
 
 
-class PredictionHistoryView(generics.ListAPIView):
+@method_decorator(csrf_exempt, name='dispatch')
+class PredictBatchView(APIView):
+    """
+    Classify many skill lists or text blobs in one request.
+
+    Valid items are scored together and saved with a single bulk insert;
+    invalid items are reported by index without failing the batch.
+    """
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        context = explanation_context(request)
+        serializer = BatchPredictionRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = []
+        valid = []
+        for index, item in enumerate(serializer.validated_data["items"]):
+            item_serializer = BatchPredictionItemSerializer(data=item)
+            if not item_serializer.is_valid():
+                results.append({"index": index, "status": "invalid", "errors": item_serializer.errors})
+                continue
+            results.append(None)
+            valid.append((index, item_serializer.validated_data))
+
+        texts = [
+            ", ".join(data["skills"]) if "skills" in data else data["text"]
+            for _, data in valid
+        ]
+        classified = predict_roles_from_texts(texts)
+        predictions = []
+        for (_, data), result in zip(valid, classified):
+            predictions.append(
+                Prediction(
+                    user=request.user,
+                    input_skills=data.get("skills", {}),
+                    resume_text=data.get("text", ""),
+                    predicted_role=result.role,
+                    confidence=result.confidence,
+                    rule_version=result.rule_version,
+                    explanation=result.explanation,
+                )
+            )
+
+        with transaction.atomic():
+            created = Prediction.objects.bulk_create(predictions)
+            # bulk_create sends no post_save signals.
+            record_predictions(created)
+
+        for (index, _), prediction, result in zip(valid, created, classified):
+            data = PredictionSerializer(prediction, context=context).data
+            data["alternatives"] = RoleScoreSerializer(result.alternatives, many=True).data
+            results[index] = {"index": index, "status": "ok", "prediction": data}
+
+        return Response(
+            {
+                "count": len(results),
+                "created": len(created),
+                "failed": len(results) - len(created),
+                "results": results,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class PredictionHistoryView(PredictionListMixin, generics.ListAPIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
     serializer_class = PredictionSerializer
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         return Prediction.objects.filter(user=self.request.user)
 
 
-class PredictionListCreateAPIView(generics.ListCreateAPIView):
+class PredictionStatsView(APIView):
+    """The user's own totals, aggregated over all of their predictions rather than one history page."""
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        predictions = Prediction.objects.filter(user=request.user).order_by()
+        totals = predictions.aggregate(
+            total=Count("id"),
+            avg_confidence=Avg("confidence"),
+            resume_uploads=Count("id", filter=Q(resume_blob__isnull=False) | ~Q(resume_file="")),
+        )
+        top_role = (
+            predictions.values("predicted_role")
+            .annotate(total=Count("id"))
+            .order_by("-total", "predicted_role")
+            .first()
+        )
+        return Response({
+            "total_predictions": totals["total"],
+            "most_predicted_role": top_role["predicted_role"] if top_role else None,
+            "avg_confidence": round(totals["avg_confidence"], 4) if totals["avg_confidence"] is not None else None,
+            "resume_uploads": totals["resume_uploads"],
+        })
+
+
+class PredictionListCreateAPIView(PredictionListMixin, generics.ListCreateAPIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
     serializer_class = PredictionSerializer
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         return Prediction.objects.filter(user=self.request.user)
@@ -94,10 +338,81 @@ class PredictionListCreateAPIView(generics.ListCreateAPIView):
         serializer.save(user=self.request.user)
 
 
-class AllPredictionHistoryView(generics.ListAPIView):
+class AllPredictionHistoryView(PredictionListMixin, generics.ListAPIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
     serializer_class = PredictionSerializer
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
-        return Prediction.objects.all().order_by('-created_at')
+        return Prediction.objects.all()
+
+
+class PredictionExportView(APIView):
+    """
+    Stream every prediction matching the filters as CSV or NDJSON
+    (``?output=``, optionally ``&gzip=1``). Filters: ``since`` and ``until``
+    (inclusive dates), ``role`` (repeatable or comma-separated) and ``user``
+    (id, username or email).
+    """
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAdminRole]
+
+    def get(self, request):
+        params = PredictionExportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        options = params.validated_data
+
+        roles = [role.strip() for value in options.get("role", []) for role in value.split(",") if role.strip()]
+        try:
+            queryset = export_queryset(
+                since=options.get("since"),
+                until=options.get("until"),
+                roles=roles,
+                user=options.get("user"),
+            )
+        except ObjectDoesNotExist:
+            raise ValidationError({"user": "No such user."})
+
+        output, compress = options["output"], options["gzip"]
+        response = StreamingHttpResponse(
+            stream_export(queryset, output=output, compress=compress),
+            content_type="application/gzip" if compress else EXPORT_FORMATS[output][0],
+        )
+        response["Content-Disposition"] = content_disposition_header(
+            as_attachment=True, filename=export_filename(output, compress)
+        )
+        return response
+
+
+class PredictionResumeDownloadView(APIView):
+    """
+    Download the resume behind a prediction. The file itself is sent by the
+    web server or object store (see RESUME_DOWNLOAD_MODE), not by Django.
+    """
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        predictions = Prediction.objects.only("id", "user_id", "resume_file")
+        if not IsAdminRole().has_permission(request, self):
+            predictions = predictions.filter(user=request.user)
+        prediction = get_object_or_404(predictions, pk=pk)
+        if not prediction.resume_file:
+            raise Http404("This prediction has no resume file.")
+        return file_download_response(prediction.resume_file, filename=f"resume-{prediction.pk}.pdf")
+
+
+class PredictionEngineStatusView(APIView):
+    """Admin view of the classifier currently loaded in this worker."""
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAdminRole]
+
+    def get(self, request):
+        model = get_role_model()
+        return Response({
+            "rules": get_rule_registry().status(),
+            "cache": get_prediction_cache().stats(),
+            "model": model.status() if model else None,
+            "pdf_sandbox": pdf_sandbox_stats(),
+        })
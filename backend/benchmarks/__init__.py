@@ -0,0 +1,8 @@
+"""
+Benchmarks for the prediction and PDF extraction hot paths.
+
+Run from the backend directory:
+
+    python -m benchmarks                  # compare against benchmarks/baseline.json
+    python -m benchmarks --update-baseline
+"""
@@ -0,0 +1,88 @@
+"""
+Run the benchmark suites and compare them with the stored baseline.
+
+Exits non-zero when any benchmark's p95 regresses past the tolerance.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--suite", action="append", choices=["classifier", "extraction", "requests", "serialization"],
+                        help="Suite to run (repeatable); defaults to all")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="Allowed relative p95 slowdown before failing (0.5 = 50%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.2,
+                        help="Ignore p95 slowdowns smaller than this many milliseconds")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every iteration count")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+
+    import django
+    django.setup()
+
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+    from .harness import find_regressions, load_baseline, measure, save_baseline
+    from .suites import SUITES
+
+    selected = args.suite or list(SUITES)
+    results = []
+
+    setup_test_environment()
+    old_db_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root, ALLOWED_HOSTS=["*"]):
+            for suite in selected:
+                for name, func, iterations, *rows in SUITES[suite]():
+                    result = measure(name, func, max(1, int(iterations * args.scale)))
+                    results.append(result)
+                    throughput = f"  {rows[0] / result.p50_ms * 1000:>10,.0f} rows/s" if rows and result.p50_ms else ""
+                    print(
+                        f"{name:<40} p50 {result.p50_ms:>9.3f} ms  p95 {result.p95_ms:>9.3f} ms  "
+                        f"p99 {result.p99_ms:>9.3f} ms  peak {result.peak_kb:>9.1f} KB{throughput}",
+                        flush=True,
+                    )
+    finally:
+        connection.creation.destroy_test_db(old_db_name, verbosity=0)
+        teardown_test_environment()
+
+    if args.update_baseline:
+        save_baseline(args.baseline, results)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return 0
+
+    regressions = find_regressions(results, baseline, args.tolerance, args.min_delta_ms)
+    if regressions:
+        print("\nPERFORMANCE REGRESSIONS:", file=sys.stderr)
+        for line in regressions:
+            print(f"  {line}", file=sys.stderr)
+        return 1
+
+    print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Deterministic synthetic inputs: skill lists, resume texts and PDFs.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import List, Sequence
+
+SKILLS = [
+    "python", "django", "react", "javascript", "css", "html", "docker", "kubernetes", "aws",
+    "pytorch", "tensorflow", "pandas", "numpy", "statistics", "figma", "wireframe", "seo",
+    "marketing", "campaign", "recruitment", "hiring", "sales", "crm", "negotiation", "roadmap",
+    "agile", "scrum", "budget", "timeline", "logistics", "customer", "support", "writing", "blog",
+]
+
+FILLER = (
+    "responsible for delivering results across teams and collaborating with colleagues on "
+    "quarterly goals while mentoring new hires and documenting processes for the wider group"
+).split()
+
+
+def skill_lists(count: int, size: int = 6, seed: int = 7) -> List[List[str]]:
+    rng = random.Random(seed)
+    return [rng.sample(SKILLS, size) for _ in range(count)]
+
+
+def resume_text(size_bytes: int, seed: int = 7) -> str:
+    """Resume-like prose of roughly ``size_bytes`` characters."""
+    rng = random.Random(seed)
+    words: List[str] = []
+    length = 0
+    while length < size_bytes:
+        word = rng.choice(SKILLS) if rng.random() < 0.15 else rng.choice(FILLER)
+        words.append(word)
+        length += len(word) + 1
+    lines = [" ".join(words[i:i + 12]) for i in range(0, len(words), 12)]
+    return "\n".join(lines)[:size_bytes]
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: Sequence[str]) -> bytes:
+    """Build a minimal, valid PDF with one Helvetica text stream per page."""
+    objects: List[bytes] = []
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    for page_id, text in zip(page_ids, pages):
+        lines = text.splitlines() or [""]
+        body = "BT /F1 10 Tf 12 TL 50 760 Td " + " ".join(f"({_pdf_escape(line)}) Tj T*" for line in lines) + " ET"
+        stream = body.encode("latin-1", "replace")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(output)
+
+
+def resume_pdf(page_count: int, chars_per_page: int = 3000, seed: int = 7) -> bytes:
+    pages = [resume_text(chars_per_page, seed=seed + i) for i in range(page_count)]
+    return make_pdf(pages)
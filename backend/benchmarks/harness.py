@@ -0,0 +1,116 @@
+"""
+Timing and allocation measurement plus baseline comparison.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    iterations: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    peak_kb: float
+    allocated_kb: float
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(name: str, func: Callable[[], object], iterations: int, warmup: int = 2, alloc_iterations: int = 3) -> BenchmarkResult:
+    """
+    Time ``func`` over ``iterations`` calls, then re-run it a few times under
+    tracemalloc (which distorts timings) to record memory use per call.
+    """
+    for _ in range(warmup):
+        func()
+
+    gc.collect()
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - started) * 1000)
+    durations.sort()
+
+    peak = 0
+    allocated = 0
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_iterations):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            func()
+            after, call_peak = tracemalloc.get_traced_memory()
+            peak = max(peak, call_peak - before)
+            allocated = max(allocated, after - before)
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        mean_ms=round(statistics.fmean(durations), 4),
+        p50_ms=round(_percentile(durations, 0.50), 4),
+        p95_ms=round(_percentile(durations, 0.95), 4),
+        p99_ms=round(_percentile(durations, 0.99), 4),
+        peak_kb=round(peak / 1024, 1),
+        allocated_kb=round(allocated / 1024, 1),
+    )
+
+
+def load_baseline(path: str) -> Dict[str, dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh).get("results", {})
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path: str, results: List[BenchmarkResult]) -> None:
+    """Merge results into the baseline, keeping entries for suites not run."""
+    merged = load_baseline(path)
+    merged.update({r.name: asdict(r) for r in results})
+    document = {"results": merged}
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(document, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, dict],
+    tolerance: float,
+    min_delta_ms: float,
+) -> List[str]:
+    """
+    A benchmark regresses when its p95 exceeds the baseline p95 by more than
+    ``tolerance`` (relative) and ``min_delta_ms`` (absolute, to ignore
+    jitter on sub-millisecond paths).
+    """
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if not previous:
+            continue
+        limit = previous["p95_ms"] * (1 + tolerance)
+        if result.p95_ms > limit and result.p95_ms - previous["p95_ms"] > min_delta_ms:
+            regressions.append(
+                f"{result.name}: p95 {result.p95_ms:.3f} ms vs baseline {previous['p95_ms']:.3f} ms"
+            )
+    return regressions
@@ -0,0 +1,138 @@
+"""
+Benchmark definitions. Each suite yields ``(name, callable, iterations)``,
+optionally followed by the number of rows one call handles (reported as
+rows/sec).
+"""
+
+from __future__ import annotations
+
+import io
+import itertools
+from typing import Iterator, Tuple
+
+from . import generators
+
+Benchmark = Tuple  # (name, callable, iterations[, rows per call])
+
+RESUME_SIZES = [("1kb", 1024, 200), ("10kb", 10 * 1024, 100), ("100kb", 100 * 1024, 20), ("1mb", 1024 * 1024, 5)]
+PDF_PAGES = [(1, 50), (10, 10), (50, 3)]
+
+
+def classifier_benchmarks() -> Iterator[Benchmark]:
+    from apps.predictions.services import predict_role_from_text, validate_and_normalize_role
+
+    for label, size, iterations in RESUME_SIZES:
+        text = generators.resume_text(size)
+        yield f"predict_role_from_text[{label}]", lambda text=text: predict_role_from_text(text), iterations
+
+    skills = generators.skill_lists(1)[0]
+    yield "predict_role_from_text[skills]", lambda: predict_role_from_text(" ".join(skills)), 500
+
+    roles = ["Data Scientist", "Frontend Developer", "Data Analyst", "Unknown Role", ""]
+    yield "validate_and_normalize_role", lambda: [validate_and_normalize_role(r) for r in roles], 1000
+
+
+def extraction_benchmarks() -> Iterator[Benchmark]:
+    from apps.predictions.services import predict_role_from_resume
+    from core.utils import extract_text_from_pdf
+
+    for pages, iterations in PDF_PAGES:
+        data = generators.resume_pdf(pages)
+        yield f"extract_text_from_pdf[{pages}p]", lambda data=data: extract_text_from_pdf(io.BytesIO(data)), iterations
+
+    # Streaming extraction + incremental classification with early exit.
+    page = "\n".join([" ".join(generators.FILLER)] * 20 + ["python django backend"])
+    focused = generators.make_pdf([page] * 50)
+    yield "predict_role_from_resume[50p]", lambda: predict_role_from_resume(io.BytesIO(focused)), 5
+
+
+def request_benchmarks() -> Iterator[Benchmark]:
+    """Full request cycle, including JWT authentication, through the test client."""
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from django.test import Client
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from apps.accounts.models import User
+
+    user, _ = User.objects.get_or_create(username="benchmark", defaults={"email": "benchmark@example.com"})
+    token = str(RefreshToken.for_user(user).access_token)
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    skills = generators.skill_lists(1)[0]
+
+    def post_skills():
+        response = client.post("/api/predictions/skills/", {"skills": skills}, content_type="application/json")
+        assert response.status_code == 200, response.content
+
+    yield "PredictFromSkillsView", post_skills, 100
+
+    # Uploads are deduplicated by content, so the hot path (sandboxed
+    # extraction) needs new bytes on every call: a numbered line on page one.
+    pages = [generators.resume_text(3000, seed=7 + i) for i in range(3)]
+    nonces = itertools.count()
+
+    def post_resume(pdf=None):
+        if pdf is None:
+            pdf = generators.make_pdf([f"{pages[0]}\nref {next(nonces)}", *pages[1:]])
+        upload = SimpleUploadedFile("resume.pdf", pdf, content_type="application/pdf")
+        response = client.post("/api/predictions/resume/", {"resume": upload})
+        assert response.status_code in (201, 202), response.content
+
+    yield "PredictFromResumeView", post_resume, 20
+
+    # Repeat uploads of stored content reuse the blob's extracted text.
+    pdf = generators.make_pdf(pages)
+    yield "PredictFromResumeView[reuse]", lambda: post_resume(pdf), 20
+
+
+def serialization_benchmarks() -> Iterator[Benchmark]:
+    """Serializing a 10k-row prediction history: full ModelSerializer vs the slim list path."""
+    from apps.accounts.models import User
+    from apps.predictions.models import Prediction
+    from apps.predictions.serializers import PredictionListSerializer, PredictionSerializer
+
+    rows = 10_000
+    user, _ = User.objects.get_or_create(username="history", defaults={"email": "history@example.com"})
+    if not Prediction.objects.filter(user=user).exists():
+        roles = ["Data Scientist", "Web Developer", "Product Manager", "HR Manager", "DevOps Engineer"]
+        skills = generators.skill_lists(len(roles))
+        Prediction.objects.bulk_create(
+            (
+                Prediction(
+                    user=user,
+                    input_skills={skill: 1 for skill in skills[i % len(roles)]},
+                    resume_text=generators.resume_text(2048) if i % 10 == 0 else "",
+                    predicted_role=roles[i % len(roles)],
+                    confidence=0.5 + (i % 50) / 100,
+                )
+                for i in range(rows)
+            ),
+            batch_size=1000,
+        )
+    history = Prediction.objects.filter(user=user).order_by("-created_at", "-id")
+
+    def model_serializer():
+        # .all(): a fresh queryset per call, so its result cache is not reused.
+        return PredictionSerializer(history.all(), many=True).data
+
+    def list_serializer():
+        return PredictionListSerializer(history.values(*PredictionListSerializer.columns()), many=True).data
+
+    sparse = ("predicted_role", "confidence", "created_at")
+
+    def sparse_list_serializer():
+        # What a ?fields=predicted_role,confidence,created_at client costs.
+        queryset = history.values(*PredictionListSerializer.columns(sparse))
+        return PredictionListSerializer(queryset, many=True, context={"fields": sparse}).data
+
+    yield "history_serialize[model,10k]", model_serializer, 5, rows
+    yield "history_serialize[values,10k]", list_serializer, 5, rows
+    yield "history_serialize[values,sparse,10k]", sparse_list_serializer, 5, rows
+
+
+SUITES = {
+    "classifier": classifier_benchmarks,
+    "extraction": extraction_benchmarks,
+    "requests": request_benchmarks,
+    "serialization": serialization_benchmarks,
+}
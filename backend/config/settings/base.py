@@ -115,6 +115,12 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Uploads are SHA-256 hashed as they stream in (see core/uploads.py).
+FILE_UPLOAD_HANDLERS = [
+    "core.uploads.HashingMemoryFileUploadHandler",
+    "core.uploads.HashingTemporaryFileUploadHandler",
+]
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 AUTH_USER_MODEL = "accounts.User"
@@ -127,6 +133,9 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticated",
     ),
 }
+# Page sizes for core.pagination.KeysetPagination (?page_size= is capped at the max).
+API_PAGE_SIZE = env.int("API_PAGE_SIZE", default=50)
+API_MAX_PAGE_SIZE = env.int("API_MAX_PAGE_SIZE", default=500)
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=15),
@@ -166,4 +175,75 @@ BREVO_API_KEY = env("BREVO_API_KEY")
 DEFAULT_FROM_EMAIL = env.str("DEFAULT_FROM_EMAIL", default="noreply@careerpredictor.ai")
 FRONTEND_URL = env.str("FRONTEND_URL", default="http://localhost:5173")
 
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# Resume storage (core/storage.py): "core.storage.ContentAddressedStorage" on
+# local disk, or "core.storage.S3Storage" for any S3-compatible endpoint.
+RESUME_STORAGE_BACKEND = env.str("RESUME_STORAGE_BACKEND", default="core.storage.ContentAddressedStorage")
+RESUME_S3_BUCKET = env.str("RESUME_S3_BUCKET", default="")
+RESUME_S3_PREFIX = env.str("RESUME_S3_PREFIX", default="")
+RESUME_S3_ENDPOINT_URL = env.str("RESUME_S3_ENDPOINT_URL", default="")
+RESUME_S3_REGION = env.str("RESUME_S3_REGION", default="")
+RESUME_S3_URL_EXPIRES = env.int("RESUME_S3_URL_EXPIRES", default=300)
+
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+    "resumes": {"BACKEND": RESUME_STORAGE_BACKEND},
+}
+
+# How GET /api/predictions/<id>/resume/ hands the file over:
+#   "accel"    - X-Accel-Redirect to RESUME_ACCEL_REDIRECT_PREFIX. Only when nginx
+#                fronts gunicorn with an internal location mapping the prefix
+#                onto MEDIA_ROOT, e.g.
+#                    location /protected-media/ { internal; alias /app/media/; }
+#                Without it the response is an empty 200.
+#   "sendfile" - X-Sendfile with the absolute path (Apache mod_xsendfile, lighttpd;
+#                filesystem storage only, checked at startup)
+#   "redirect" - 302 to the storage URL (presigned for S3)
+#   "django"   - stream through Django (the default; prod.py uses "redirect" for S3)
+RESUME_DOWNLOAD_MODE = env.str("RESUME_DOWNLOAD_MODE", default="django")
+RESUME_ACCEL_REDIRECT_PREFIX = env.str("RESUME_ACCEL_REDIRECT_PREFIX", default="/protected-media/")
+
+# Cache: e.g. redis://localhost:6379/1 in production (shared by all workers).
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+ANALYTICS_CACHE_TTL = env.int("ANALYTICS_CACHE_TTL", default=300)
+# How overview totals are read: "counter" (maintained table), "estimate"
+# (pg_class.reltuples on PostgreSQL, counters elsewhere) or "exact" (COUNT(*)).
+ANALYTICS_COUNT_MODE = env.str("ANALYTICS_COUNT_MODE", default="counter")
+
+# Prediction engine settings
+PREDICTION_TOP_K = env.int("PREDICTION_TOP_K", default=3)
+PREDICTION_BATCH_MAX_ITEMS = env.int("PREDICTION_BATCH_MAX_ITEMS", default=1000)
+# Rows fetched per round trip while streaming an export.
+PREDICTION_EXPORT_CHUNK_SIZE = env.int("PREDICTION_EXPORT_CHUNK_SIZE", default=2000)
+PREDICTION_RULES_PATH = env.str(
+    "PREDICTION_RULES_PATH",
+    default=str(BASE_DIR / "apps" / "predictions" / "rules" / "classifier_rules.json"),
+)
+PREDICTION_RULES_CHECK_INTERVAL = env.float("PREDICTION_RULES_CHECK_INTERVAL", default=5.0)
+PREDICTION_CACHE_MAX_ENTRIES = env.int("PREDICTION_CACHE_MAX_ENTRIES", default=10000)
+PREDICTION_CACHE_TTL = env.float("PREDICTION_CACHE_TTL", default=3600.0)
+PREDICTION_MODEL_PATH = env.str("PREDICTION_MODEL_PATH", default=str(BASE_DIR / "var" / "role_model.npz"))
+PREDICTION_MODEL_MIN_CONFIDENCE = env.float("PREDICTION_MODEL_MIN_CONFIDENCE", default=0.5)
+PREDICTION_EXPLAIN_MAX_MATCHES = env.int("PREDICTION_EXPLAIN_MAX_MATCHES", default=50)
+
+# Resume PDF extraction limits and early exit
+PDF_MAX_PAGES = env.int("PDF_MAX_PAGES", default=50)
+PDF_MAX_CHARS = env.int("PDF_MAX_CHARS", default=200000)
+# Stop reading once the leading role has held for this many pages (0 disables).
+PREDICTION_EARLY_EXIT_PAGES = env.int("PREDICTION_EARLY_EXIT_PAGES", default=3)
+PREDICTION_EARLY_EXIT_MIN_SHARE = env.float("PREDICTION_EARLY_EXIT_MIN_SHARE", default=0.5)
+
+# Asynchronous resume jobs (processed by `manage.py process_resume_jobs`)
+# When enabled, resume uploads return 202 with a job ID; ?async=0/1 overrides per request.
+PREDICTION_RESUME_ASYNC = env.bool("PREDICTION_RESUME_ASYNC", default=False)
+RESUME_JOB_MAX_ATTEMPTS = env.int("RESUME_JOB_MAX_ATTEMPTS", default=3)
+RESUME_JOB_POLL_INTERVAL = env.float("RESUME_JOB_POLL_INTERVAL", default=1.0)
+RESUME_JOB_STALE_AFTER = env.int("RESUME_JOB_STALE_AFTER", default=600)
+
+# Sandboxed PDF extraction (core/pdf_sandbox.py)
+PDF_SANDBOX_ENABLED = env.bool("PDF_SANDBOX_ENABLED", default=True)
+PDF_SANDBOX_WORKERS = env.int("PDF_SANDBOX_WORKERS", default=2)
+PDF_SANDBOX_TIMEOUT = env.float("PDF_SANDBOX_TIMEOUT", default=20.0)
+PDF_SANDBOX_MEMORY_MB = env.int("PDF_SANDBOX_MEMORY_MB", default=512)
+PDF_SANDBOX_MAX_JOBS_PER_WORKER = env.int("PDF_SANDBOX_MAX_JOBS_PER_WORKER", default=100)
+PDF_SANDBOX_QUEUE_TIMEOUT = env.float("PDF_SANDBOX_QUEUE_TIMEOUT", default=10.0)
@@ -16,6 +16,14 @@ DATABASES = {
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 STATIC_URL = "/static/"
 
+# Production runs gunicorn without a front proxy, so nothing would act on an
+# X-Accel-Redirect: stream through Django, or redirect to S3 when the resumes
+# live there. "accel" is opt-in via the env var (see base.py).
+RESUME_DOWNLOAD_MODE = env.str(
+    "RESUME_DOWNLOAD_MODE",
+    default="redirect" if RESUME_STORAGE_BACKEND == "core.storage.S3Storage" else "django",
+)
+
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 SECURE_SSL_REDIRECT = False
 SESSION_COOKIE_SECURE = True
@@ -0,0 +1,82 @@
+"""
+Model fields shared across apps.
+"""
+
+import zlib
+
+from django import forms
+from django.db import models
+
+_ZLIB = b"z"
+_RAW = b"r"
+
+
+def compress_text(value: str, level: int = 6) -> bytes:
+    """Tagged zlib payload; short or incompressible text is stored raw."""
+    raw = value.encode("utf-8")
+    packed = zlib.compress(raw, level)
+    if len(packed) < len(raw):
+        return _ZLIB + packed
+    return _RAW + raw
+
+
+def decompress_text(value) -> str:
+    data = bytes(value)
+    if not data:
+        return ""
+    tag, payload = data[:1], data[1:]
+    if tag == _ZLIB:
+        return zlib.decompress(payload).decode("utf-8")
+    if tag == _RAW:
+        return payload.decode("utf-8")
+    raise ValueError(f"Unknown compressed text tag {tag!r}.")
+
+
+class CompressedTextField(models.BinaryField):
+    """
+    Text stored zlib-compressed in a binary column. Python code reads and
+    writes ``str``; compression happens on save and decompression on load,
+    so pair it with ``.defer()`` on list queries that don't need the text.
+    """
+
+    description = "Compressed text"
+
+    def __init__(self, *args, level: int = 6, **kwargs):
+        self.level = level
+        kwargs.setdefault("editable", True)
+        kwargs.setdefault("default", "")
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.level != 6:
+            kwargs["level"] = self.level
+        if kwargs.get("default") == "":
+            del kwargs["default"]
+        return name, path, args, kwargs
+
+    def _check_str_default_value(self):
+        # Defaults are text here; they are compressed like any other value.
+        return []
+
+    def get_prep_value(self, value):
+        if value is None:
+            return None
+        return super().get_prep_value(compress_text(str(value), self.level))
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return decompress_text(value)
+
+    def to_python(self, value):
+        if value is None or isinstance(value, str):
+            return value
+        return decompress_text(value)
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj) or ""
+
+    def formfield(self, **kwargs):
+        # Skip BinaryField.formfield: the form edits the decompressed text.
+        return models.Field.formfield(self, **{"form_class": forms.CharField, "widget": forms.Textarea, **kwargs})
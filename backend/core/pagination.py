@@ -0,0 +1,152 @@
+"""
+Keyset (cursor) pagination.
+
+Pages are ranges on a unique ``(timestamp, id)`` ordering rather than
+OFFSETs: the cursor is the last row seen and the next page is "rows after
+it", an index range scan that costs the same at any depth. Rows inserted
+while a client pages never shift or repeat rows on later pages.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from collections import OrderedDict
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginates newest first on ``ordering`` (a timestamp field, then a unique
+    tie-breaker). ``?page_size=`` may ask for up to ``API_MAX_PAGE_SIZE`` rows.
+    """
+
+    ordering = ("-created_at", "-id")
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor."
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return settings.API_PAGE_SIZE
+        return max(1, min(page_size, settings.API_MAX_PAGE_SIZE))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.fields = [name.lstrip("-") for name in self.ordering]
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor["reverse"])
+
+        ordering = self.ordering
+        if reverse:
+            # Walk backwards from the cursor, then flip the page into display order.
+            ordering = tuple(name[1:] if name.startswith("-") else f"-{name}" for name in ordering)
+        queryset = queryset.order_by(*ordering)
+        if cursor:
+            queryset = queryset.filter(self._after(cursor["position"], descending=ordering[0].startswith("-")))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        # Forwards, older rows exist if the page overflowed and newer ones if we
+        # started from a cursor; backwards it is the other way round.
+        has_next, has_previous = (True, has_more) if reverse else (has_more, cursor is not None)
+        self.next_position = self._position(rows[-1]) if rows and has_next else None
+        self.previous_position = self._position(rows[0]) if rows and has_previous else None
+        return rows
+
+    def _after(self, position, descending: bool) -> Q:
+        # (a, b) < (x, y)  ==  a <= x AND (a < x OR b < y); the leading range
+        # condition keeps it an index range scan.
+        (first, second), (value, tie) = self.fields, position
+        op = "lt" if descending else "gt"
+        bound = "lte" if descending else "gte"
+        return Q(**{f"{first}__{bound}": value}) & (
+            Q(**{f"{first}__{op}": value}) | Q(**{f"{second}__{op}": tie})
+        )
+
+    def _position(self, row):
+        # Rows may be model instances or .values() dicts.
+        if isinstance(row, dict):
+            return [row[field] for field in self.fields]
+        return [getattr(row, field) for field in self.fields]
+
+    def encode_cursor(self, position, reverse: bool = False) -> str:
+        value, tie = position
+        payload = {"p": [value.isoformat(), tie], "r": reverse}
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)))
+            value, tie = payload["p"]
+            return {"position": [datetime.fromisoformat(value), int(tie)], "reverse": bool(payload.get("r"))}
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _link(self, position, reverse: bool):
+        if position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(position, reverse=reverse))
+
+    def get_next_link(self):
+        return self._link(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        return self._link(self.previous_position, reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque position returned in next/previous.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"Rows per page (at most {settings.API_MAX_PAGE_SIZE}).",
+                "schema": {"type": "integer"},
+            },
+        ]
@@ -0,0 +1,363 @@
+"""
+Sandboxed PDF text extraction.
+
+PyPDF2 runs in a small pool of spawned worker processes so a pathological
+PDF can only hurt a disposable child: every job has a wall-clock deadline,
+each child runs under an RLIMIT_AS address-space cap, and children are
+recycled after a fixed number of jobs. The parent pulls pages one at a time
+("lock-step"), so callers can still stop reading early.
+"""
+
+from __future__ import annotations
+
+import atexit
+import io
+import multiprocessing
+import threading
+import time
+from typing import Iterator
+
+from django.conf import settings
+from PyPDF2.errors import PyPdfError
+
+from .utils import PdfTextStream
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+class PdfExtractionError(Exception):
+    """
+    The PDF could not be read. ``reason`` is one of ``invalid``, ``timeout``,
+    ``memory``, ``crashed`` or ``busy``.
+    """
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+def _worker_main(conn, memory_limit_bytes: int, max_jobs: int) -> None:
+    if resource is not None and memory_limit_bytes:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+
+    jobs = 0
+    while not max_jobs or jobs < max_jobs:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message[0] != "open":
+            continue
+        jobs += 1
+
+        _, data, max_pages, max_chars = message
+        try:
+            stream = PdfTextStream(io.BytesIO(data), max_pages=max_pages, max_chars=max_chars)
+            del data
+            conn.send(("meta", stream.pages_total))
+            pages = iter(stream)
+            while conn.recv() == "next":
+                page_text = next(pages, None)
+                if page_text is None:
+                    conn.send(("end", stream.truncated))
+                else:
+                    conn.send(("page", page_text, stream.truncated))
+        except MemoryError:
+            conn.send(("error", "memory", "The PDF needs more memory than extraction is allowed."))
+            return
+        except Exception as exc:
+            conn.send(("error", "invalid", f"Could not read the PDF: {exc}"))
+
+
+class _Worker:
+    def __init__(self, context, memory_limit_bytes: int, max_jobs: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit_bytes, max_jobs),
+            name="pdf-sandbox",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.max_jobs = max_jobs
+        self.jobs = 0
+
+    @property
+    def exhausted(self) -> bool:
+        return bool(self.max_jobs) and self.jobs >= self.max_jobs
+
+    def request(self, message, deadline: float):
+        self.conn.send(message)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not self.conn.poll(remaining):
+            raise TimeoutError
+        return self.conn.recv()
+
+    def stop(self, kill: bool = False) -> None:
+        self.conn.close()
+        if kill:
+            self.process.kill()
+        self.process.join(timeout=5)
+
+
+class SandboxedPdfStream:
+    """Page iterator over a PDF open in a sandbox worker; mirrors ``PdfTextStream``."""
+
+    def __init__(self, pool: "PdfSandboxPool", worker: _Worker, deadline: float):
+        self._pool = pool
+        self._worker: _Worker | None = worker
+        self._deadline = deadline
+        self.pages_total = 0
+        self.pages_read = 0
+        self.chars_read = 0
+        self.truncated = False
+
+    def _request(self, message):
+        worker = self._worker
+        try:
+            reply = worker.request(message, self._deadline)
+        except TimeoutError:
+            self._release(healthy=False)
+            self._pool._count("timeouts")
+            raise PdfExtractionError(
+                "timeout", f"PDF extraction took longer than {self._pool.timeout:g} seconds."
+            ) from None
+        except (EOFError, OSError):
+            self._release(healthy=False)
+            self._pool._count("crashes")
+            raise PdfExtractionError("crashed", "The PDF parser stopped unexpectedly.") from None
+
+        if reply[0] == "error":
+            _, reason, text = reply
+            # An invalid PDF leaves the child ready for its next job.
+            self._release(healthy=reason == "invalid")
+            self._pool._count("memory_errors" if reason == "memory" else "invalid")
+            raise PdfExtractionError(reason, text)
+        return reply
+
+    def _release(self, healthy: bool) -> None:
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            self._pool._checkin(worker, healthy=healthy)
+
+    def __iter__(self) -> Iterator[str]:
+        while self._worker is not None:
+            reply = self._request("next")
+            if reply[0] == "end":
+                self.truncated = reply[1]
+                return
+            _, page_text, truncated = reply
+            self.pages_read += 1
+            self.chars_read += len(page_text)
+            self.truncated = truncated
+            yield page_text
+
+    def close(self) -> None:
+        worker = self._worker
+        if worker is None:
+            return
+        try:
+            worker.conn.send("close")
+        except OSError:
+            self._release(healthy=False)
+        else:
+            self._release(healthy=True)
+
+    def __enter__(self) -> "SandboxedPdfStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class PdfSandboxPool:
+    """
+    Bounded pool of extraction processes. Callers beyond ``workers`` wait up
+    to ``queue_timeout`` seconds for a free worker.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        timeout: float = 20.0,
+        memory_limit_mb: int = 512,
+        max_jobs_per_worker: int = 100,
+        queue_timeout: float = 10.0,
+    ):
+        self.workers = max(workers, 1)
+        self.timeout = timeout
+        self.memory_limit_bytes = memory_limit_mb * 1024 * 1024 if memory_limit_mb else 0
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.queue_timeout = queue_timeout
+        # spawn, not fork: never copy a threaded web worker into the sandbox.
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: list[_Worker] = []
+        self._busy = 0
+        self._waiting = 0
+        self._cond = threading.Condition()
+        self._counters = {
+            "jobs": 0,
+            "started": 0,
+            "recycled": 0,
+            "kills": 0,
+            "timeouts": 0,
+            "crashes": 0,
+            "memory_errors": 0,
+            "invalid": 0,
+            "rejected": 0,
+        }
+
+    def _count(self, name: str) -> None:
+        with self._cond:
+            self._counters[name] += 1
+
+    def _checkout(self) -> _Worker:
+        deadline = time.monotonic() + self.queue_timeout
+        with self._cond:
+            self._waiting += 1
+            try:
+                while not self._idle and self._busy >= self.workers:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._counters["rejected"] += 1
+                        raise PdfExtractionError("busy", "All PDF extraction workers are busy; try again shortly.")
+                    self._cond.wait(remaining)
+                self._busy += 1
+                worker = self._idle.pop() if self._idle else None
+            finally:
+                self._waiting -= 1
+
+        if worker is not None and worker.process.is_alive():
+            return worker
+        if worker is not None:
+            worker.stop()
+        try:
+            worker = _Worker(self._context, self.memory_limit_bytes, self.max_jobs_per_worker)
+        except BaseException:
+            self._checkin(None, healthy=False)
+            raise
+        self._count("started")
+        return worker
+
+    def _checkin(self, worker: _Worker | None, healthy: bool) -> None:
+        if worker is not None:
+            if healthy and not worker.exhausted:
+                with self._cond:
+                    self._idle.append(worker)
+                    self._busy -= 1
+                    self._cond.notify()
+                return
+            if healthy:
+                # The child exits by itself once it has served max_jobs.
+                worker.stop()
+                self._count("recycled")
+            else:
+                if worker.process.is_alive():
+                    self._count("kills")
+                worker.stop(kill=True)
+        with self._cond:
+            self._busy -= 1
+            self._cond.notify()
+
+    def open(self, file_obj, max_pages: int | None = None, max_chars: int | None = None) -> SandboxedPdfStream:
+        if hasattr(file_obj, "seek"):
+            file_obj.seek(0)
+        data = file_obj.read()
+
+        worker = self._checkout()
+        worker.jobs += 1
+        self._count("jobs")
+        stream = SandboxedPdfStream(self, worker, time.monotonic() + self.timeout)
+        _, stream.pages_total = stream._request(("open", data, max_pages, max_chars))
+        return stream
+
+    def shutdown(self) -> None:
+        with self._cond:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "enabled": True,
+                "workers": self.workers,
+                "idle": len(self._idle),
+                "busy": self._busy,
+                "queue_depth": self._waiting,
+                "timeout_seconds": self.timeout,
+                "memory_limit_mb": self.memory_limit_bytes // (1024 * 1024) or None,
+                "max_jobs_per_worker": self.max_jobs_per_worker,
+                **self._counters,
+            }
+
+
+class _LocalPdfStream(PdfTextStream):
+    """In-process extraction (sandbox disabled) with the same error surface."""
+
+    def __init__(self, file_obj, max_pages: int | None = None, max_chars: int | None = None):
+        try:
+            super().__init__(file_obj, max_pages=max_pages, max_chars=max_chars)
+        except (PyPdfError, ValueError) as exc:
+            raise PdfExtractionError("invalid", f"Could not read the PDF: {exc}") from exc
+
+    def __iter__(self) -> Iterator[str]:
+        try:
+            yield from super().__iter__()
+        except (PyPdfError, ValueError) as exc:
+            raise PdfExtractionError("invalid", f"Could not read the PDF: {exc}") from exc
+
+    def __enter__(self) -> "_LocalPdfStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_pool: PdfSandboxPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pdf_sandbox() -> PdfSandboxPool:
+    """Process-wide sandbox pool configured from settings."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = PdfSandboxPool(
+                    workers=settings.PDF_SANDBOX_WORKERS,
+                    timeout=settings.PDF_SANDBOX_TIMEOUT,
+                    memory_limit_mb=settings.PDF_SANDBOX_MEMORY_MB,
+                    max_jobs_per_worker=settings.PDF_SANDBOX_MAX_JOBS_PER_WORKER,
+                    queue_timeout=settings.PDF_SANDBOX_QUEUE_TIMEOUT,
+                )
+                atexit.register(_pool.shutdown)
+    return _pool
+
+
+def open_pdf_pages(
+    file_obj,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+    pool: PdfSandboxPool | None = None,
+):
+    """
+    Context-managed page stream for ``file_obj``: sandboxed (in ``pool``, or
+    the shared pool) when ``PDF_SANDBOX_ENABLED`` is set, in-process
+    otherwise. Both raise ``PdfExtractionError`` for unreadable PDFs.
+    """
+    if pool is not None:
+        return pool.open(file_obj, max_pages=max_pages, max_chars=max_chars)
+    if settings.PDF_SANDBOX_ENABLED:
+        return get_pdf_sandbox().open(file_obj, max_pages=max_pages, max_chars=max_chars)
+    return _LocalPdfStream(file_obj, max_pages=max_pages, max_chars=max_chars)
+
+
+def pdf_sandbox_stats() -> dict:
+    if not settings.PDF_SANDBOX_ENABLED:
+        return {"enabled": False}
+    return get_pdf_sandbox().stats()
@@ -0,0 +1,228 @@
+"""
+Storage backends for uploaded resumes.
+
+Both backends are content-addressed: a file is stored under its SHA-256
+digest, sharded two levels deep (``resumes/ab/cd/abcd....pdf``), so saving
+the same bytes twice writes nothing new. Files are hashed and written in
+chunks, never read fully into memory.
+
+Select the backend with ``STORAGES["resumes"]``; model fields resolve it
+lazily through ``get_resume_storage``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import posixpath
+import tempfile
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage, Storage, storages
+from django.http import FileResponse, HttpResponse, HttpResponseRedirect
+from django.utils.deconstruct import deconstructible
+from django.utils.module_loading import import_string
+from django.utils.http import content_disposition_header
+
+try:
+    import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.exceptions import ClientError
+except ImportError:  # boto3 is only needed for the S3 backend
+    boto3 = None
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def content_address(name: str, digest: str) -> str:
+    """``resumes/cv.pdf`` + digest -> ``resumes/ab/cd/<digest>.pdf``."""
+    directory = posixpath.dirname(name)
+    extension = os.path.splitext(name)[1].lower()
+    return posixpath.join(directory, digest[:2], digest[2:4], f"{digest}{extension}")
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """Local filesystem storage that names files by their SHA-256 digest."""
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is chosen from the content in _save; an existing
+        # file with the same name already holds the same bytes.
+        return name
+
+    def _save(self, name, content):
+        directory = self.path(posixpath.dirname(name) or ".")
+        os.makedirs(directory, exist_ok=True)
+
+        sha256 = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".upload")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                if hasattr(content, "seek"):
+                    content.seek(0)
+                for chunk in content.chunks(CHUNK_SIZE):
+                    sha256.update(chunk)
+                    fh.write(chunk)
+
+            final_name = content_address(name, sha256.hexdigest())
+            final_path = self.path(final_name)
+            if os.path.exists(final_path):
+                os.unlink(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                if self.file_permissions_mode is not None:
+                    os.chmod(tmp_path, self.file_permissions_mode)
+                os.replace(tmp_path, final_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return final_name
+
+
+@deconstructible
+class S3Storage(Storage):
+    """
+    Content-addressed storage in an S3-compatible bucket. ``endpoint_url``
+    points it at any S3 API (MinIO, LocalStack, moto) for local use.
+    """
+
+    def __init__(
+        self,
+        bucket_name: str | None = None,
+        prefix: str | None = None,
+        endpoint_url: str | None = None,
+        region_name: str | None = None,
+        url_expires: int | None = None,
+    ):
+        if boto3 is None:
+            raise ImproperlyConfigured("S3Storage requires boto3 (pip install boto3).")
+        self.bucket_name = bucket_name or settings.RESUME_S3_BUCKET
+        if not self.bucket_name:
+            raise ImproperlyConfigured("Set RESUME_S3_BUCKET to use S3Storage.")
+        self.prefix = (prefix if prefix is not None else settings.RESUME_S3_PREFIX).strip("/")
+        self.endpoint_url = endpoint_url or settings.RESUME_S3_ENDPOINT_URL or None
+        self.region_name = region_name or settings.RESUME_S3_REGION or None
+        self.url_expires = url_expires or settings.RESUME_S3_URL_EXPIRES
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = boto3.client("s3", endpoint_url=self.endpoint_url, region_name=self.region_name)
+        return self._client
+
+    def _key(self, name: str) -> str:
+        return posixpath.join(self.prefix, name) if self.prefix else name
+
+    def _save(self, name, content):
+        if hasattr(content, "seek"):
+            content.seek(0)
+        digest = getattr(content, "sha256", None)
+        if digest:
+            body = content
+        else:
+            # Hash while spooling so the key is known before the upload starts.
+            sha256 = hashlib.sha256()
+            body = tempfile.SpooledTemporaryFile(max_size=CHUNK_SIZE * 8)
+            for chunk in content.chunks(CHUNK_SIZE):
+                sha256.update(chunk)
+                body.write(chunk)
+            body.seek(0)
+            digest = sha256.hexdigest()
+
+        final_name = content_address(name, digest)
+        try:
+            if not self.exists(final_name):
+                self.client.upload_fileobj(
+                    body,
+                    self.bucket_name,
+                    self._key(final_name),
+                    ExtraArgs={"ContentType": getattr(content, "content_type", None) or "application/pdf"},
+                    Config=TransferConfig(multipart_chunksize=CHUNK_SIZE * 8),
+                )
+        finally:
+            if body is not content:
+                body.close()
+        return final_name
+
+    def _open(self, name, mode="rb"):
+        spooled = tempfile.SpooledTemporaryFile(max_size=CHUNK_SIZE * 8)
+        self.client.download_fileobj(self.bucket_name, self._key(name), spooled)
+        spooled.seek(0)
+        return File(spooled, name=name)
+
+    def get_available_name(self, name, max_length=None):
+        return name
+
+    def exists(self, name):
+        try:
+            self.client.head_object(Bucket=self.bucket_name, Key=self._key(name))
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
+
+    def delete(self, name):
+        self.client.delete_object(Bucket=self.bucket_name, Key=self._key(name))
+
+    def size(self, name):
+        return self.client.head_object(Bucket=self.bucket_name, Key=self._key(name))["ContentLength"]
+
+    def url(self, name):
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket_name, "Key": self._key(name)},
+            ExpiresIn=self.url_expires,
+        )
+
+
+def get_resume_storage():
+    """Storage for resume files (``STORAGES["resumes"]``); a callable so fields resolve it lazily."""
+    return storages["resumes"]
+
+
+DOWNLOAD_MODES = ("accel", "sendfile", "redirect", "django")
+
+
+def check_download_mode():
+    """
+    Reject a ``RESUME_DOWNLOAD_MODE`` the resume storage cannot serve; called
+    at startup so a bad combination fails the deploy instead of each download.
+    """
+    mode = settings.RESUME_DOWNLOAD_MODE
+    if mode not in DOWNLOAD_MODES:
+        raise ImproperlyConfigured(f"RESUME_DOWNLOAD_MODE must be one of: {', '.join(DOWNLOAD_MODES)}.")
+    backend = import_string(settings.STORAGES["resumes"]["BACKEND"])
+    if mode == "sendfile" and not issubclass(backend, FileSystemStorage):
+        # X-Sendfile needs a local path; object stores should use "redirect".
+        raise ImproperlyConfigured(
+            f"RESUME_DOWNLOAD_MODE 'sendfile' needs filesystem storage, not {backend.__name__}; use 'redirect'."
+        )
+
+
+def file_download_response(field_file, filename: str, content_type: str = "application/pdf"):
+    """
+    Response that lets the web server (or object store) send ``field_file``
+    instead of Django, according to ``RESUME_DOWNLOAD_MODE``.
+    """
+    mode = settings.RESUME_DOWNLOAD_MODE
+    if mode == "redirect":
+        return HttpResponseRedirect(field_file.url)
+    if mode == "django":
+        return FileResponse(field_file.open("rb"), as_attachment=True, filename=filename, content_type=content_type)
+
+    response = HttpResponse(content_type=content_type)
+    if mode == "accel":
+        prefix = settings.RESUME_ACCEL_REDIRECT_PREFIX.rstrip("/")
+        response["X-Accel-Redirect"] = f"{prefix}/{quote(field_file.name)}"
+    elif mode == "sendfile":
+        response["X-Sendfile"] = field_file.path
+    else:
+        raise ImproperlyConfigured(f"Unknown RESUME_DOWNLOAD_MODE '{mode}'.")
+    response["Content-Disposition"] = content_disposition_header(as_attachment=True, filename=filename)
+    return response
@@ -0,0 +1,49 @@
+"""
+Upload handlers that compute a SHA-256 digest while the request body streams
+in, so content-addressed storage never has to re-read the uploaded file.
+The digest is exposed as ``uploaded_file.sha256``.
+"""
+
+import hashlib
+
+from django.core.files.uploadhandler import MemoryFileUploadHandler, TemporaryFileUploadHandler
+
+
+class Sha256UploadMixin:
+    def new_file(self, *args, **kwargs):
+        # Set before super(): an activated handler raises StopFutureHandlers.
+        self.sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        remaining = super().receive_data_chunk(raw_data, start)
+        if remaining is None:
+            # This handler consumed the chunk; handlers passing it on don't hash it.
+            self.sha256.update(raw_data)
+        return remaining
+
+    def file_complete(self, file_size):
+        uploaded = super().file_complete(file_size)
+        if uploaded is not None:
+            uploaded.sha256 = self.sha256.hexdigest()
+        return uploaded
+
+
+class HashingMemoryFileUploadHandler(Sha256UploadMixin, MemoryFileUploadHandler):
+    pass
+
+
+class HashingTemporaryFileUploadHandler(Sha256UploadMixin, TemporaryFileUploadHandler):
+    pass
+
+
+def file_sha256(uploaded) -> str:
+    """Digest recorded during upload, or computed from the file's chunks."""
+    digest = getattr(uploaded, "sha256", None)
+    if digest:
+        return digest
+    sha256 = hashlib.sha256()
+    for chunk in uploaded.chunks():
+        sha256.update(chunk)
+    uploaded.seek(0)
+    return sha256.hexdigest()
@@ -1,15 +1,47 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterator
 
 from PyPDF2 import PdfReader
 
 
-def extract_text_from_pdf(file_obj) -> str:
-    reader = PdfReader(file_obj)
-    parts: Iterable[str] = []
-    text_parts = []
-    for page in reader.pages:
-        page_text = page.extract_text() or ""
-        text_parts.append(page_text)
-    return "\n".join(text_parts).strip()
+class PdfTextStream:
+    """
+    Lazily yields the text of each PDF page, stopping at ``max_pages`` pages
+    or ``max_chars`` characters. Callers may stop iterating early; only the
+    pages actually consumed are extracted.
+    """
+
+    def __init__(self, file_obj, max_pages: int | None = None, max_chars: int | None = None):
+        self._reader = PdfReader(file_obj)
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.pages_total = len(self._reader.pages)
+        self.pages_read = 0
+        self.chars_read = 0
+        self.truncated = False
+
+    def __iter__(self) -> Iterator[str]:
+        for page in self._reader.pages:
+            if self.max_pages is not None and self.pages_read >= self.max_pages:
+                self.truncated = True
+                return
+
+            page_text = page.extract_text() or ""
+            if self.max_chars is not None and self.chars_read + len(page_text) > self.max_chars:
+                page_text = page_text[: self.max_chars - self.chars_read]
+                self.truncated = True
+
+            self.pages_read += 1
+            self.chars_read += len(page_text)
+            yield page_text
+            if self.truncated:
+                return
+
+
+def iter_pdf_pages(file_obj, max_pages: int | None = None, max_chars: int | None = None) -> PdfTextStream:
+    return PdfTextStream(file_obj, max_pages=max_pages, max_chars=max_chars)
+
+
+def extract_text_from_pdf(file_obj, max_pages: int | None = None, max_chars: int | None = None) -> str:
+    return "\n".join(iter_pdf_pages(file_obj, max_pages=max_pages, max_chars=max_chars)).strip()
@@ -58,16 +58,12 @@ export function AnalyticsPage() {
     async function load() {
       setLoading(true)
       try {
-        const [r1, r2, r3] = await Promise.all([
-          analyticsApi.roles(), 
-          analyticsApi.monthly(6),
-          analyticsApi.getOverview()
-        ])
-        
-        const rolesData = r1.data.distribution || []
+        const { data } = await analyticsApi.dashboard({ include: 'overview,roles,monthly', periods: 6 })
+
+        const rolesData = data.roles?.distribution || []
         setRoles(rolesData)
-        setMonthly(r2.data)
-        setOverview(r3.data)
+        setMonthly(data.monthly)
+        setOverview(data.overview)
       } catch (e) {
         console.error('Analytics fetch error:', e)
         toast.error('Failed to load analytics: ' + (e.response?.data?.message || e.message))
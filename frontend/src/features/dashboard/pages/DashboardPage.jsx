@@ -25,34 +25,19 @@ export function DashboardPage() {
   async function loadKpis() {
     setLoading(true)
     try {
-      console.log('Loading KPIs...')
-      const [historyRes, overviewRes] = await Promise.all([
-        predictionsApi.getHistory(),
+      const [statsRes, overviewRes] = await Promise.all([
+        predictionsApi.getStats(),
         analyticsApi.getOverview()
       ])
       
-      console.log('History response:', historyRes)
-      console.log('Overview response:', overviewRes)
-      
-      const history = Array.isArray(historyRes.data) ? historyRes.data : (historyRes.data?.results || [])
+      const stats = statsRes.data
       const overview = overviewRes.data
       
-      const roleCounts = history.reduce((acc, pred) => {
-        acc[pred.predicted_role] = (acc[pred.predicted_role] || 0) + 1
-        return acc
-      }, {})
-      
-      const mostPredicted = Object.entries(roleCounts).sort((a, b) => b[1] - a[1])[0]?.[0] || '—'
-      const avgConf = history.length > 0 
-        ? history.reduce((sum, pred) => sum + (pred.confidence || 0), 0) / history.length 
-        : 0
-      const resumeCount = history.filter(pred => pred.resume_text).length
-      
       setKpis({
-        totalPredictions: overview?.total_predictions || history.length || 0,
-        mostPredictedRole: mostPredicted,
-        avgConfidence: Math.round(avgConf * 100),
-        resumeUploadCount: resumeCount
+        totalPredictions: overview?.total_predictions || stats.total_predictions || 0,
+        mostPredictedRole: stats.most_predicted_role || '—',
+        avgConfidence: Math.round((stats.avg_confidence || 0) * 100),
+        resumeUploadCount: stats.resume_uploads || 0
       })
     } catch (e) {
       console.error('Failed to load KPIs:', e)
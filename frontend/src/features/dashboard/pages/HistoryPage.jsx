@@ -8,6 +8,8 @@ import { RoleBadge } from '../../../components/ui/RoleBadge'
 export function HistoryPage() {
   const [data, setData] = useState([])
   const [loading, setLoading] = useState(true)
+  const [nextUrl, setNextUrl] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [searchTerm, setSearchTerm] = useState('')
   const [currentPage, setCurrentPage] = useState(1)
   const itemsPerPage = 10
@@ -26,6 +28,7 @@ export function HistoryPage() {
       console.log('Processed rows:', rows)
       console.log('Total predictions loaded:', rows.length)
       setData(rows)
+      setNextUrl(res.data?.next || null)
     } catch (e) {
       console.error('Failed to load prediction history:', e)
       toast.error('Failed to load prediction history')
@@ -34,6 +37,21 @@ export function HistoryPage() {
     }
   }
 
+  async function loadMore() {
+    if (!nextUrl) return
+    setLoadingMore(true)
+    try {
+      const res = await predictionsApi.getPage(nextUrl)
+      setData(prev => [...prev, ...(res.data?.results || [])])
+      setNextUrl(res.data?.next || null)
+    } catch (e) {
+      console.error('Failed to load more history:', e)
+      toast.error('Failed to load more history')
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const filteredData = useMemo(() => {
     if (!searchTerm) return data
     
@@ -277,6 +295,19 @@ export function HistoryPage() {
             </div>
           </div>
         )}
+
+        {/* Older predictions are fetched from the server a page at a time */}
+        {nextUrl && currentPage === totalPages && (
+          <div className="px-6 py-4 border-t border-gray-200 dark:border-gray-700 text-center">
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="px-4 py-2 rounded-lg text-sm font-medium bg-white dark:bg-gray-800 border border-gray-300 dark:border-gray-600 text-gray-700 dark:text-gray-300 hover:bg-gray-50 dark:hover:bg-gray-700 disabled:opacity-50 disabled:cursor-not-allowed transition-colors"
+            >
+              {loadingMore ? 'Loading...' : 'Load older predictions'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   )
@@ -1,6 +1,9 @@
 import apiClient from './apiClient'
 
 export const analyticsApi = {
+  dashboard(params = {}) {
+    return apiClient.get('/analytics/dashboard/', { params })
+  },
   overview() {
     return apiClient.get('/analytics/overview/')
   },
@@ -17,7 +17,15 @@ export const predictionsApi = {
   getHistory() {
     return apiClient.get('/predictions/history/')
   },
-  getAllHistory() {
-    return apiClient.get('/predictions/all-history/')
+  // Totals over all of the user's predictions (history is paginated).
+  getStats() {
+    return apiClient.get('/predictions/stats/')
+  },
+  getAllHistory(params = {}) {
+    return apiClient.get('/predictions/all-history/', { params })
+  },
+  // History endpoints are cursor-paginated; follow the `next` URL they return.
+  getPage(url) {
+    return apiClient.get(url)
   },
 }